@@ -1,12 +1,15 @@
 # article_domain/application/article_service.py
 """Application services for Article domain."""
 
+import concurrent.futures
 import logging
 from typing import Iterator
 
 from src.article_domain.domain.repositories.article_repository import IArticleRepository
 from src.article_domain.infrastructure.api_clients.ecc_api_client import ECCApiClient
+from src.common.config.settings import settings
 from src.common.dtos.article_dtos import ArticleDataDTO
+from src.common.exceptions.custom_exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,30 @@ class ArticleApplicationService:
         for i in range(0, len(pairs), chunk_size):
             yield pairs[i : i + chunk_size]
 
+    def _save_articles_individually(self, article_dtos: list[ArticleDataDTO], batch_num: int) -> int:
+        """
+        Saves articles one by one so a single bad row does not drop the whole batch.
+        Saves run concurrently; one pooled connection is left free for the caller and other repositories.
+        Failures are collected and reported once for the batch.
+        """
+        saved_count = 0
+        failures: list[tuple[str | None, str]] = []
+        max_workers = max(1, min(settings.DB_POOL_SIZE - 1, len(article_dtos)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_article = {
+                executor.submit(self.article_repo.save_article, article_dto): article_dto for article_dto in article_dtos
+            }
+            for future in concurrent.futures.as_completed(future_to_article):
+                try:
+                    future.result()
+                    saved_count += 1
+                except Exception as e:  # noqa: PERF203
+                    failures.append((future_to_article[future].ean, str(e)))
+
+        if failures:
+            logger.warning(f"Batch {batch_num} had {len(failures)} failed article saves (first 10 EAN/error): {failures[:10]}")
+        return saved_count
+
     # def sync_articles_from_ecc(self, supplier_gtin_pairs: list[tuple[str, str]]) -> None:
     #     """Fetches article data from ECC API using supplier GLN and GTIN pairs."""
     #     logger.info(f"Synchronizing articles from ECC for {len(supplier_gtin_pairs)} supplier GLN and GTIN pairs")
@@ -48,48 +75,52 @@ class ArticleApplicationService:
         total_articles_saved = 0
         failed_batches = 0
 
-        # Process pairs in batches
-        for batch_num, batch_pairs in enumerate(self._chunk_pairs(supplier_gtin_pairs, self.batch_size), 1):
-            batch_size_actual = len(batch_pairs)
-            logger.info(
-                f"Processing batch {batch_num}: pairs {processed_count + 1}-{processed_count + batch_size_actual} of {total_pairs}"
-            )
+        batches = list(self._chunk_pairs(supplier_gtin_pairs, self.batch_size))
 
-            try:
-                # Fetch articles for current batch
-                article_dtos = self.ecc_api_client.fetch_articles_by_gtin(batch_pairs)
+        # Pipeline: while a batch is being saved, the next one is already fetched from the API.
+        # A single fetch worker keeps at most one batch in flight ahead of the saves.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as fetch_executor:
+            next_fetch = fetch_executor.submit(self.ecc_api_client.fetch_articles_by_gtin, batches[0]) if batches else None
 
-                if not article_dtos:
-                    logger.warning(f"No data received from API for batch {batch_num}")
-                    processed_count += batch_size_actual
-                    continue
+            # Process pairs in batches
+            for batch_num, batch_pairs in enumerate(batches, 1):
+                fetch_future = next_fetch
+                if batch_num < len(batches):
+                    next_fetch = fetch_executor.submit(self.ecc_api_client.fetch_articles_by_gtin, batches[batch_num])
 
-                # Save articles from current batch
-                batch_saved_count = 0
-                batch_failed_count = 0
+                batch_size_actual = len(batch_pairs)
+                logger.info(
+                    f"Processing batch {batch_num}: pairs {processed_count + 1}-{processed_count + batch_size_actual} of {total_pairs}"
+                )
 
-                for article_dto in article_dtos:
-                    try:
-                        self.article_repo.save_article(article_dto)
-                        batch_saved_count += 1
-                    except Exception as e:  # noqa: PERF203
-                        batch_failed_count += 1
-                        gtin = getattr(article_dto, "gtin", "unknown")
-                        logger.error(f"Failed to save article {gtin}: {e}")
+                try:
+                    # Wait for the articles of the current batch
+                    article_dtos = fetch_future.result()
+
+                    if not article_dtos:
+                        logger.warning(f"No data received from API for batch {batch_num}")
+                        processed_count += batch_size_actual
                         continue
 
-                total_articles_saved += batch_saved_count
-                processed_count += batch_size_actual
+                    # Save articles from current batch in one round-trip
+                    try:
+                        batch_saved_count = self.article_repo.save_articles_bulk(article_dtos)
+                    except DatabaseError as e:
+                        logger.warning(f"Bulk save failed for batch {batch_num}, saving articles one by one: {e}")
+                        batch_saved_count = self._save_articles_individually(article_dtos, batch_num)
 
-                logger.info(
-                    f"Batch {batch_num} completed: {batch_saved_count} articles saved from {len(article_dtos)} received"
-                )
+                    total_articles_saved += batch_saved_count
+                    processed_count += batch_size_actual
 
-            except Exception as e:
-                failed_batches += 1
-                logger.error(f"Error processing batch {batch_num}: {e}")
-                processed_count += batch_size_actual
-                continue
+                    logger.info(
+                        f"Batch {batch_num} completed: {batch_saved_count} articles saved from {len(article_dtos)} received"
+                    )
+
+                except Exception as e:
+                    failed_batches += 1
+                    logger.error(f"Error processing batch {batch_num}: {e}")
+                    processed_count += batch_size_actual
+                    continue
 
         logger.info(f"Batch synchronization completed:")
         logger.info(f"  - Total processed pairs: {processed_count}")
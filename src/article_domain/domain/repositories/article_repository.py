@@ -1,6 +1,7 @@
 # article_domain/domain/repositories/article_repository.py
 """Article repository interface."""
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from src.common.dtos.article_dtos import ArticleDataDTO
 
@@ -11,12 +12,27 @@ class IArticleRepository(ABC):
         """Saves or updates article data in the persistence layer."""
         pass
 
+    @abstractmethod
+    def save_articles_bulk(self, article_dtos: list[ArticleDataDTO]) -> int:
+        """Saves or updates multiple articles in a single batch operation. Returns the number of rows sent."""
+        pass
+
     @abstractmethod
     def get_article_by_ecc_id(self, ecc_id: int) -> ArticleDataDTO:
         """Retrieves an article by its ECC ID."""
         pass
 
+    @abstractmethod
+    def get_articles_by_ecc_ids(self, ecc_ids: list[int]) -> dict[int, list[ArticleDataDTO]]:
+        """Retrieves several articles at once, grouped by their ECC ID (an ECC ID may match several rows)."""
+        pass
+
     @abstractmethod
     def get_all_articles(self) -> list[ArticleDataDTO]:
         """Retrieves all articles."""
         pass
+
+    @abstractmethod
+    def iter_all_articles(self) -> Iterator[ArticleDataDTO]:
+        """Streams all articles without loading the whole table into memory."""
+        pass
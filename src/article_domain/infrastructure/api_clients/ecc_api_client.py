@@ -1,10 +1,13 @@
 # article_domain/infrastructure/api_clients/ecc_api_client.py
 """Client for ECC Content Article API."""
 
+import concurrent.futures
 import json
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.common.config.settings import settings
 from src.common.dtos.article_dtos import ArticleDataDTO
@@ -18,36 +21,86 @@ class ECCApiClient:
         self.base_url = settings.ECC_API_BASE_URL
         self.token = settings.ECC_API_TOKEN
         self.chunk_size = 100
+        self.max_workers = settings.ECC_API_MAX_WORKERS
+
+        # Configure session with keep-alive connection pooling and retry strategy
+        self.session = requests.Session()
+        self.session.params = {"token": self.token}
+        retry_strategy = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            backoff_factor=0.3,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,  # One kept-alive connection per worker thread
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Closes the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ECCApiClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _fetch_articles_for_pair(self, su_gln: str, ean: str, country_code: str) -> list[ArticleDataDTO]:
+        """Fetches articles for a single supplier GLN and GTIN pair. Errors are logged, not raised."""
+        url = f"{self.base_url}/articleData/byEanAndSuGln/{ean}/{su_gln}/{country_code}"
+        logger.info(f"Get data for {ean} {su_gln}")
+
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+
+            if "articles" in data and data["articles"]:
+                return [ArticleDataDTO.from_api_response(item, ean) for item in data["articles"]]
+
+            logger.warning(f"No articles found for EAN: {ean}, Supplier GLN: {su_gln}")
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API request failed for EAN {ean}, Supplier GLN {su_gln}: {e}")
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode JSON response for EAN {ean}, Supplier GLN {su_gln}: {e}")
+        except ValueError as e:
+            logger.error(f"Invalid article data for EAN {ean}, Supplier GLN {su_gln}: {e}")
+
+        return []
 
     def fetch_articles_by_gtin(self, supplier_gtin_pairs: list[tuple[str, str]]) -> list[ArticleDataDTO]:
-        """Fetches article data from ECC API using supplier GLN and GTIN pairs."""
+        """
+        Fetches article data from ECC API using supplier GLN and GTIN pairs.
+
+        Duplicate pairs are requested only once. Requests are I/O-bound, so they run concurrently
+        in a thread pool of up to `max_workers` threads. Results keep the order of the input pairs.
+        """
         all_fetched_dtos = []
         if not self.token:
             raise APIError("ECC_API_TOKEN is not set in environment variables.")
 
+        if not supplier_gtin_pairs:
+            return all_fetched_dtos
+
+        # dict.fromkeys keeps the first occurrence order while dropping duplicates
+        unique_pairs = list(dict.fromkeys(supplier_gtin_pairs))
+        if len(unique_pairs) < len(supplier_gtin_pairs):
+            logger.info(f"Skipping {len(supplier_gtin_pairs) - len(unique_pairs)} duplicate supplier GLN and GTIN pairs")
+
         country_code = "de"  # Default country code
-        params = {"token": self.token}
-
-        for su_gln, ean in supplier_gtin_pairs:
-            url = f"{self.base_url}/articleData/byEanAndSuGln/{ean}/{su_gln}/{country_code}"
-            logger.info(f"Get data for {ean} {su_gln}")
-
-            try:
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-
-                if "articles" in data and data["articles"]:
-                    article_dtos = [ArticleDataDTO.from_api_response(item, ean) for item in data["articles"]]
-                    all_fetched_dtos.extend(article_dtos)
-                else:
-                    logger.warning(f"No articles found for EAN: {ean}, Supplier GLN: {su_gln}")
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"API request failed for EAN {ean}, Supplier GLN {su_gln}: {e}")
-                continue  # Continue with next pair instead of failing completely
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response for EAN {ean}, Supplier GLN {su_gln}: {e}")
-                continue
+        max_workers = max(1, min(self.max_workers, len(unique_pairs)))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda pair: self._fetch_articles_for_pair(pair[0], pair[1], country_code), unique_pairs
+            )
+            for article_dtos in results:
+                all_fetched_dtos.extend(article_dtos)
 
         return all_fetched_dtos
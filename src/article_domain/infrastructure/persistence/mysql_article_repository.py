@@ -1,41 +1,110 @@
 # ruff: noqa: E501
 # article_domain/infrastructure/persistence/mysql_article_repository.py
 """MySQL implementation of Article repository."""
-import json
+import dataclasses
+import functools
 import logging
+import operator
+from typing import Iterator
 
-import mysql.connector
+import orjson
 from mysql.connector import Error
 
 from src.article_domain.domain.repositories.article_repository import IArticleRepository
-from src.common.config.settings import settings
 from src.common.dtos.article_dtos import ArticleDataDTO
 from src.common.exceptions.custom_exceptions import DatabaseError
 from src.common.utils.date_utils import format_date_for_db, format_datetime_for_db
+from src.common.utils.db_utils import pooled_connection
 
 logger = logging.getLogger(__name__)
 
+# Fixed column order for pds_articles, derived once from the DTO definition
+ARTICLE_COLUMNS: tuple[str, ...] = tuple(f.name for f in dataclasses.fields(ArticleDataDTO))
+# Primary key columns are never part of the ON DUPLICATE KEY UPDATE clause
+ARTICLE_KEY_COLUMNS: frozenset[str] = frozenset({"ean", "suGln"})
+
+# Secondary indexes of pds_articles; MySQL names each unnamed INDEX (col) after its column
+ARTICLE_SECONDARY_INDEXES: tuple[str, ...] = (
+    "eccId",
+    "mainArticleEccId",
+    "suGln",
+    "mfGln",
+    "brandOriginal",
+    "brandCleared",
+    "catalogId",
+    "dateChanged",
+    "seasonEccId",
+    "gender",
+    "ageGroup",
+    "productCategoryEccId",
+    "productGroupEccId",
+    "productSubGroupEccId",
+    "productFamilyEccId",
+    "colorCode",
+    "colorName",
+    "size",
+    "eccSizeId",
+    "sortIdx",
+)
+
+# Serialized empty images list, reused instead of encoding [] for every row
+_EMPTY_IMAGES = orjson.dumps([]).decode()
+
+
+def _images_to_json(images: list | None) -> str:
+    """Serializes the images list for the JSON column (str, since MySQL rejects binary JSON input)."""
+    return orjson.dumps(images).decode() if images else _EMPTY_IMAGES
+
+
+# Columns whose Python value has to be converted before it is sent to MySQL
+_COLUMN_CONVERTERS = {
+    "dateChanged": format_datetime_for_db,
+    "seasonDateFrom": format_date_for_db,
+    "seasonDateTo": format_date_for_db,
+    "images": _images_to_json,
+}
+# Reads all columns of a DTO in ARTICLE_COLUMNS order in one C-level call
+_ROW_GETTER = operator.attrgetter(*ARTICLE_COLUMNS)
+_CONVERTED_POSITIONS = tuple((ARTICLE_COLUMNS.index(col), converter) for col, converter in _COLUMN_CONVERTERS.items())
+
+# Only real pds_articles columns may be used as search filters (they are interpolated into SQL)
+_SEARCHABLE_COLUMNS: frozenset[str] = frozenset(ARTICLE_COLUMNS)
+# Upper bound for values in one IN (...) filter, keeps the statement small to send and parse
+MAX_IN_FILTER_VALUES = 1000
+
+
+@functools.lru_cache(maxsize=128)
+def _search_sql(filter_signature: tuple[tuple[str, int | None], ...]) -> str:
+    """
+    Builds the SELECT statement for one combination of filters.
+    Each entry is (column, None) for an equality filter or (column, n) for an IN filter with n values.
+    """
+    query = "SELECT * FROM pds_articles"
+    if filter_signature:
+        conditions = [
+            f"{col} = %s" if count is None else f"{col} IN ({','.join(['%s'] * count)})"
+            for col, count in filter_signature
+        ]
+        query += " WHERE " + " AND ".join(conditions)
+    return query
 
-class MySQLArticleRepository(IArticleRepository):
-    def __init__(self) -> None:
-        self._connection = None
 
-    def _get_connection(self):
-        if not self._connection or not self._connection.is_connected():
-            try:
-                self._connection = mysql.connector.connect(
-                    host=settings.DB_HOST,
-                    database=settings.DB_DATABASE,
-                    user=settings.DB_USER,
-                    password=settings.DB_PASSWORD,
-                )
-            except Error as e:
-                raise DatabaseError(f"Failed to connect to MySQL: {e}", original_exception=e)
-        return self._connection
+class MySQLArticleRepository(IArticleRepository):
+    """MySQL implementation of the Article Repository. Connections are borrowed from the shared pool."""
+
+    # NULL values never overwrite existing data: COALESCE keeps the stored value
+    _UPSERT_SQL = (
+        f"INSERT INTO pds_articles ({', '.join(ARTICLE_COLUMNS)}) "
+        f"VALUES ({', '.join(['%s'] * len(ARTICLE_COLUMNS))}) "
+        "ON DUPLICATE KEY UPDATE "
+        + ", ".join(
+            f"{col} = COALESCE(VALUES({col}), {col})" for col in ARTICLE_COLUMNS if col not in ARTICLE_KEY_COLUMNS
+        )
+    )
 
     def create_tables(self) -> None:
         """Creates or updates tables for the Article domain with 'pds_' prefix."""
-        create_articles_table_query = """
+        create_articles_table_query = f"""
         CREATE TABLE IF NOT EXISTS pds_articles (
             eccId INT UNSIGNED,
             ean VARCHAR(255) NOT NULL,
@@ -93,44 +162,65 @@ class MySQLArticleRepository(IArticleRepository):
             sizeOrderQuantity INT UNSIGNED,
             images JSON,
             PRIMARY KEY (ean, suGln),
-            INDEX (eccId),
-            INDEX (mainArticleEccId),
-            INDEX (suGln),
-            INDEX (mfGln),
-            INDEX (brandOriginal),
-            INDEX (brandCleared),
-            INDEX (catalogId),
-            INDEX (dateChanged),
-            INDEX (seasonEccId),
-            INDEX (gender),
-            INDEX (ageGroup),
-            INDEX (productCategoryEccId),
-            INDEX (productGroupEccId),
-            INDEX (productSubGroupEccId),
-            INDEX (productFamilyEccId),
-            INDEX (colorCode),
-            INDEX (colorName),
-            INDEX (size),
-            INDEX (eccSizeId),
-            INDEX (sortIdx)
+            {", ".join(f"INDEX {col} ({col})" for col in ARTICLE_SECONDARY_INDEXES)}
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
         """
 
-        cursor = self._get_connection().cursor()
-        try:
-            cursor.execute(create_articles_table_query)
-            self._get_connection().commit()
-            logger.info("PDS Article table checked/created.")
-        except Error as e:
-            self._get_connection().rollback()
-            raise DatabaseError(f"Error creating PDS Article table: {e}", original_exception=e)
-        finally:
-            cursor.close()
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(create_articles_table_query)
+                conn.commit()
+                logger.info("PDS Article table checked/created.")
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error creating PDS Article table: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    def _existing_secondary_indexes(self, cursor) -> set[str]:
+        """Returns the names of ARTICLE_SECONDARY_INDEXES currently present on pds_articles."""
+        cursor.execute(
+            "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'pds_articles'"
+        )
+        return {row[0] for row in cursor.fetchall()} & set(ARTICLE_SECONDARY_INDEXES)
+
+    def drop_secondary_indexes(self) -> None:
+        """
+        Drops the secondary indexes of pds_articles before a large import so inserts only
+        maintain the primary key. Restore them with rebuild_secondary_indexes().
+        """
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                existing = self._existing_secondary_indexes(cursor)
+                if existing:
+                    drops = ", ".join(f"DROP INDEX {col}" for col in ARTICLE_SECONDARY_INDEXES if col in existing)
+                    cursor.execute(f"ALTER TABLE pds_articles {drops}")
+                logger.info(f"Dropped {len(existing)} secondary indexes on pds_articles for bulk load.")
+            except Error as e:
+                raise DatabaseError(f"Error dropping pds_articles secondary indexes: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    def rebuild_secondary_indexes(self) -> None:
+        """Recreates any missing secondary indexes of pds_articles in a single ALTER TABLE."""
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                existing = self._existing_secondary_indexes(cursor)
+                missing = [col for col in ARTICLE_SECONDARY_INDEXES if col not in existing]
+                if missing:
+                    adds = ", ".join(f"ADD INDEX {col} ({col})" for col in missing)
+                    cursor.execute(f"ALTER TABLE pds_articles {adds}")
+                logger.info(f"Rebuilt {len(missing)} secondary indexes on pds_articles.")
+            except Error as e:
+                raise DatabaseError(f"Error rebuilding pds_articles secondary indexes: {e}", original_exception=e)
+            finally:
+                cursor.close()
 
     def save_article(self, article_dto: ArticleDataDTO) -> None:
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         # Проверяем обязательные поля перед сохранением
         if not article_dto.ean or not article_dto.suGln:
             error_msg = (
@@ -139,69 +229,110 @@ class MySQLArticleRepository(IArticleRepository):
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        article_main_data = article_dto.__dict__.copy()
+        params = self._to_row(article_dto)
 
-        # Обработка дат
-        article_main_data["dateChanged"] = format_datetime_for_db(article_main_data.get("dateChanged"))
-        article_main_data["seasonDateFrom"] = format_date_for_db(article_main_data.get("seasonDateFrom"))
-        article_main_data["seasonDateTo"] = format_date_for_db(article_main_data.get("seasonDateTo"))
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                logger.info(
+                    f"Attempting to save article: EAN={article_dto.ean}, suGln={article_dto.suGln}, eccId={article_dto.eccId}"
+                )
+                cursor.execute(self._UPSERT_SQL, params)
+
+                # Проверяем результат операции
+                if cursor.rowcount > 0:
+                    if cursor.rowcount == 1:
+                        logger.info(f"Article inserted: EAN={article_dto.ean}, suGln={article_dto.suGln}")
+                    elif cursor.rowcount == 2:
+                        logger.info(f"Article updated: EAN={article_dto.ean}, suGln={article_dto.suGln}")
+                else:
+                    logger.warning(f"No rows affected for article: EAN={article_dto.ean}, suGln={article_dto.suGln}")
 
-        # Обработка изображений
-        if "images" in article_main_data and article_main_data["images"]:
-            article_main_data["images"] = json.dumps(article_main_data["images"])
-        else:
-            article_main_data["images"] = json.dumps([])
+                conn.commit()
+                logger.info(f"Article {article_dto.eccId} (EAN={article_dto.ean}) saved successfully.")
 
-        # Удаляем None значения для корректной вставки
-        article_main_data = {k: v for k, v in article_main_data.items() if v is not None}
+            except Error as e:
+                conn.rollback()
+                logger.error(f"Failed to save article: EAN={article_dto.ean}, suGln={article_dto.suGln}, Error: {e}")
+                # Добавляем более детальную информацию об ошибке
+                if "Duplicate entry" in str(e):
+                    logger.error(f"Duplicate key error - this should not happen with ON DUPLICATE KEY UPDATE")
+                elif "Data too long" in str(e):
+                    logger.error(f"Data too long error - check field lengths")
+                elif "cannot be null" in str(e):
+                    logger.error(f"NULL constraint violation - check required fields")
+                raise DatabaseError(
+                    f"Error saving article EAN={article_dto.ean}, suGln={article_dto.suGln}: {e}", original_exception=e
+                )
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _to_row(article_dto: ArticleDataDTO) -> tuple:
+        """Builds a value tuple in ARTICLE_COLUMNS order with dates and images converted for MySQL."""
+        row = list(_ROW_GETTER(article_dto))
+        for position, converter in _CONVERTED_POSITIONS:
+            row[position] = converter(row[position])
+        return tuple(row)
+
+    def save_articles_bulk(self, article_dtos: list[ArticleDataDTO], chunk_size: int = 500) -> int:
+        """
+        Saves or updates multiple articles in one transaction.
+        Returns the number of articles sent; articles without ean or suGln are skipped and not counted.
 
-        columns = ", ".join(article_main_data.keys())
-        placeholders = ", ".join(["%s"] * len(article_main_data))
-        update_set = ", ".join([f"{col} = %s" for col in article_main_data])
+        Rows are sent in chunks of `chunk_size`; mysql-connector rewrites each executemany into
+        one multi-row INSERT, so a chunk is one round-trip and the statement stays below
+        max_allowed_packet even for wide rows.
+        """
+        valid_dtos = []
+        for article_dto in article_dtos:
+            if not article_dto.ean or not article_dto.suGln:
+                logger.error(
+                    f"Skipping article with missing required fields - ean: {article_dto.ean}, suGln: {article_dto.suGln}"
+                )
+                continue
+            valid_dtos.append(article_dto)
 
-        insert_query = (
-            f"INSERT INTO pds_articles ({columns}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_set}"
-        )
-        values = list(article_main_data.values())
-        params = values + values
+        if not valid_dtos:
+            return 0
 
-        try:
-            logger.info(
-                f"Attempting to save article: EAN={article_dto.ean}, suGln={article_dto.suGln}, eccId={article_dto.eccId}"
-            )
-            cursor.execute(insert_query, params)
-
-            # Проверяем результат операции
-            if cursor.rowcount > 0:
-                if cursor.rowcount == 1:
-                    logger.info(f"Article inserted: EAN={article_dto.ean}, suGln={article_dto.suGln}")
-                elif cursor.rowcount == 2:
-                    logger.info(f"Article updated: EAN={article_dto.ean}, suGln={article_dto.suGln}")
-            else:
-                logger.warning(f"No rows affected for article: EAN={article_dto.ean}, suGln={article_dto.suGln}")
-
-            conn.commit()
-            logger.info(f"Article {article_dto.eccId} (EAN={article_dto.ean}) saved successfully.")
-
-        except Error as e:
-            conn.rollback()
-            logger.error(f"Failed to save article: EAN={article_dto.ean}, suGln={article_dto.suGln}, Error: {e}")
-            # Добавляем более детальную информацию об ошибке
-            if "Duplicate entry" in str(e):
-                logger.error(f"Duplicate key error - this should not happen with ON DUPLICATE KEY UPDATE")
-            elif "Data too long" in str(e):
-                logger.error(f"Data too long error - check field lengths")
-            elif "cannot be null" in str(e):
-                logger.error(f"NULL constraint violation - check required fields")
-            raise DatabaseError(
-                f"Error saving article EAN={article_dto.ean}, suGln={article_dto.suGln}: {e}", original_exception=e
-            )
-        finally:
-            cursor.close()
+        params_list = [self._to_row(article_dto) for article_dto in valid_dtos]
 
-    def get_all_articles(self, limit: int = None, offset: int = 0) -> list[ArticleDataDTO]:
-        conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for start in range(0, len(params_list), chunk_size):
+                    cursor.executemany(self._UPSERT_SQL, params_list[start : start + chunk_size])
+                conn.commit()
+                logger.info(f"Bulk saved {len(valid_dtos)} articles.")
+                return len(valid_dtos)
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error bulk saving {len(valid_dtos)} articles: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _row_to_dto(row: dict) -> ArticleDataDTO:
+        """Builds an ArticleDataDTO from a pds_articles row, decoding the images JSON column."""
+        if row.get("images"):
+            try:
+                row["images"] = orjson.loads(row["images"])
+            except (orjson.JSONDecodeError, TypeError):
+                row["images"] = []
+        else:
+            row["images"] = []
+        return ArticleDataDTO(**row)
+
+    def iter_all_articles(
+        self, limit: int = None, offset: int = 0, fetch_size: int = 1000
+    ) -> Iterator[ArticleDataDTO]:
+        """
+        Streams articles from pds_articles using an unbuffered cursor.
+
+        Only `fetch_size` rows are held in memory at a time. The pooled connection stays
+        borrowed until the iterator is exhausted or closed.
+        """
         query = "SELECT * FROM pds_articles"
         params = []
 
@@ -209,113 +340,139 @@ class MySQLArticleRepository(IArticleRepository):
             query += " LIMIT %s OFFSET %s"
             params = [limit, offset]
 
-        try:
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            articles = []
-            for row in rows:
-                if row.get("images"):
-                    try:
-                        row["images"] = json.loads(row["images"])
-                    except (json.JSONDecodeError, TypeError):
-                        row["images"] = []
-                else:
-                    row["images"] = []
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_dto(row)
+            except Error as e:
+                raise DatabaseError(f"Error fetching articles: {e}", original_exception=e)
+            finally:
+                # Rows left unread by an early stop must be drained before the connection is reused
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
 
-                articles.append(ArticleDataDTO(**row))
+    def get_all_articles(self, limit: int = None, offset: int = 0) -> list[ArticleDataDTO]:
+        """
+        Retrieves articles as a list.
 
-            return articles
+        Deprecated: loads the whole result into memory, use iter_all_articles for large tables.
+        """
+        return list(self.iter_all_articles(limit=limit, offset=offset))
 
-        except Error as e:
-            raise DatabaseError(f"Error fetching articles: {e}", original_exception=e)
-        finally:
-            cursor.close()
+    def get_articles_by_ecc_ids(self, ecc_ids: list[int], fetch_size: int = 1000) -> dict[int, list[ArticleDataDTO]]:
+        """
+        Retrieves several articles in one query, grouped by their ECC ID.
+        eccId is not unique (the primary key is ean, suGln), so each ID maps to all of its rows in result order.
+        """
+        unique_ids = list(dict.fromkeys(ecc_ids))
+        if not unique_ids:
+            return {}
 
-    def get_article_by_ecc_id(self, ecc_id: int) -> ArticleDataDTO | None:
-        """Retrieves a single article by its ECC ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
-        article_dto = None
-        try:
-            cursor.execute("SELECT * FROM pds_articles WHERE eccId = %s", (ecc_id,))
-            row = cursor.fetchone()
-
-            if row.get("images"):
-                try:
-                    row["images"] = json.loads(row["images"])
-                except (json.JSONDecodeError, TypeError):
-                    row["images"] = []
-            else:
-                row["images"] = []
+        placeholders = ",".join(["%s"] * len(unique_ids))
+        query = f"SELECT * FROM pds_articles WHERE eccId IN ({placeholders})"
 
-            article_dto = ArticleDataDTO(**row)
-        except Error as e:
-            raise DatabaseError(f"Error fetching article by eccId {ecc_id}: {e}", original_exception=e)
-        finally:
-            cursor.close()
-        return article_dto
+        articles: dict[int, list[ArticleDataDTO]] = {}
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query, tuple(unique_ids))
+                while True:
+                    rows = cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        article_dto = self._row_to_dto(row)
+                        articles.setdefault(article_dto.eccId, []).append(article_dto)
+            except Error as e:
+                raise DatabaseError(f"Error fetching {len(unique_ids)} articles by eccId: {e}", original_exception=e)
+            finally:
+                # Rows left unread after an error must be drained before the connection is reused
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
+        return articles
 
-    def __del__(self) -> None:
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
+    def get_article_by_ecc_id(self, ecc_id: int) -> ArticleDataDTO | None:
+        """Retrieves the first article row with the given ECC ID."""
+        matches = self.get_articles_by_ecc_ids([ecc_id]).get(ecc_id)
+        return matches[0] if matches else None
 
     def delete_article(self, ecc_id: int) -> None:
         """Delete article by eccId."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM pds_articles WHERE eccId = %s", (ecc_id,))
+                conn.commit()
 
-        try:
-            cursor.execute("DELETE FROM pds_articles WHERE eccId = %s", (ecc_id,))
-            conn.commit()
+                if cursor.rowcount == 0:
+                    logger.warning(f"Article with eccId {ecc_id} not found for deletion")
+                else:
+                    logger.info(f"Article {ecc_id} deleted successfully.")
 
-            if cursor.rowcount == 0:
-                logger.warning(f"Article with eccId {ecc_id} not found for deletion")
-            else:
-                logger.info(f"Article {ecc_id} deleted successfully.")
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error deleting article {ecc_id}: {e}", original_exception=e)
+            finally:
+                cursor.close()
 
-        except Error as e:
-            conn.rollback()
-            raise DatabaseError(f"Error deleting article {ecc_id}: {e}", original_exception=e)
-        finally:
-            cursor.close()
+    def iter_search_articles(self, fetch_size: int = 1000, **filters) -> Iterator[ArticleDataDTO]:
+        """
+        Streams articles matching the filters using an unbuffered cursor.
 
-    def search_articles(self, **filters) -> list[ArticleDataDTO]:
-        """Search articles by different filtres."""
-        conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
+        A list, tuple or set value matches any of its values (one IN filter instead of one query per value).
+        Raises ValueError for unknown columns or IN filters longer than MAX_IN_FILTER_VALUES.
+        """
+        unknown_columns = filters.keys() - _SEARCHABLE_COLUMNS
+        if unknown_columns:
+            raise ValueError(f"Cannot search articles by unknown columns: {', '.join(sorted(unknown_columns))}")
 
-        where_conditions = []
+        # Sorted keys give a stable statement per filter combination, so the SQL is built once
+        filter_signature = []
         params = []
-
-        for field, value in filters.items():
-            if value is not None:
-                where_conditions.append(f"{field} = %s")
+        for field in sorted(filters):
+            value = filters[field]
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, frozenset)):
+                if not value:
+                    return  # An empty IN filter matches nothing
+                if len(value) > MAX_IN_FILTER_VALUES:
+                    raise ValueError(
+                        f"Too many values for filter {field}: {len(value)} (maximum {MAX_IN_FILTER_VALUES})"
+                    )
+                filter_signature.append((field, len(value)))
+                params.extend(value)
+            else:
+                filter_signature.append((field, None))
                 params.append(value)
+        query = _search_sql(tuple(filter_signature))
 
-        query = "SELECT * FROM pds_articles"
-        if where_conditions:
-            query += " WHERE " + " AND ".join(where_conditions)
-
-        try:
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            articles = []
-            for row in rows:
-                if row.get("images"):
-                    try:
-                        row["images"] = json.loads(row["images"])
-                    except (json.JSONDecodeError, TypeError):
-                        row["images"] = []
-                else:
-                    row["images"] = []
-
-                articles.append(ArticleDataDTO(**row))
-
-            return articles
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_dto(row)
+            except Error as e:
+                raise DatabaseError(f"Error searching articles: {e}", original_exception=e)
+            finally:
+                # Rows left unread by an early stop must be drained before the connection is reused
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
 
-        except Error as e:
-            raise DatabaseError(f"Error searching articles: {e}", original_exception=e)
-        finally:
-            cursor.close()
+    def search_articles(self, **filters) -> list[ArticleDataDTO]:
+        """Search articles by different filtres. Raises ValueError for unknown columns."""
+        return list(self.iter_search_articles(**filters))
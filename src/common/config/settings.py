@@ -13,12 +13,25 @@ class Settings:
     DB_DATABASE: str = os.getenv("DB_NAME", "product_data_db")  # Renamed for clarity across projects
     DB_USER: str = os.getenv("DB_USER", "user")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "password")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))  # mysql-connector allows at most 32
+    # How long to wait for a free pooled connection before failing (the pool itself does not block)
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "5"))
+    ARTICLE_BATCH_SIZE: int = int(os.getenv("ARTICLE_BATCH_SIZE", "100"))  # Supplier/GTIN pairs per sync batch
+    # Drop pds_articles secondary indexes during the article sync and rebuild them afterwards (initial imports)
+    ARTICLE_DEFER_INDEXES: bool = os.getenv("ARTICLE_DEFER_INDEXES", "false").lower() == "true"
 
     ECC_API_BASE_URL: str = os.getenv("ECC_API_BASE_URL")
     ECC_API_TOKEN: str = os.getenv("ECC_API_TOKEN")
+    ECC_API_MAX_WORKERS: int = int(os.getenv("ECC_API_MAX_WORKERS", "16"))  # Concurrent article requests
 
     EAN_AVAILABILITY_API_BASE_URL: str = os.getenv("EAN_AVAILABILITY_API_BASE_URL")
     EAN_AVAILABILITY_API_TOKEN: Optional[str] = os.getenv("EAN_AVAILABILITY_API_TOKEN")
+    STOCK_SYNC_MAX_WORKERS: int = int(os.getenv("STOCK_SYNC_MAX_WORKERS", "4"))  # Suppliers synced concurrently
+    STOCK_API_MAX_WORKERS: int = int(os.getenv("STOCK_API_MAX_WORKERS", "4"))  # Concurrent GTIN requests per batch
+    STOCK_API_RATE_LIMIT: float = float(os.getenv("STOCK_API_RATE_LIMIT", "10"))  # GTIN requests per second
+    STOCK_API_BURST: int = int(os.getenv("STOCK_API_BURST", "10"))  # Requests allowed back to back before limiting
+    # Skip re-fetching GTINs whose stock was synced less than this many seconds ago (0 = always re-fetch)
+    STOCK_REFRESH_TTL_SECONDS: int = int(os.getenv("STOCK_REFRESH_TTL_SECONDS", "0"))
 
     RETAILER_ID: str = os.getenv("RETAILER_ID", "default_retailer_id")
     RETAILER_GLN: str = os.getenv("RETAILER_GLN", "default_retailer_gln")
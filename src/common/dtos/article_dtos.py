@@ -3,12 +3,39 @@
 import dataclasses
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-logger = logging.getLogger(__name__)
+from src.common.utils.string_utils import intern_str
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# (API key, DTO field, transform) triples copied from the ECC article payload;
+# low-cardinality codes are interned so millions of articles share the same string objects
+_API_TO_DTO_KEYS: tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...] = (
+    ("eccId", "eccId", None),
+    ("suGln", "suGln", None),
+    ("mfGln", "mfGln", None),
+    ("suArticleNumber", "suArticleNumber", None),
+    ("mfArticleNumber", "mfArticleNumber", None),
+    ("brand", "brandOriginal", intern_str),
+    ("brand", "brandCleared", intern_str),
+    ("model", "modelName", None),
+    ("articleName", "articleName", None),
+    ("currency", "currency", intern_str),
+    ("seasonTxt", "seasonName", intern_str),
+    # Добавленные поля
+    ("colorCode", "colorCode", intern_str),
+    ("colorName", "colorName", None),
+    ("customsTariffNumber", "customsTariffNumber", None),
+    ("tax", "tax", None),
+    ("shoeWidth", "shoeWidth", None),
+    ("materialName", "materialName", None),
+    ("innerMaterial", "innerMaterial", None),
+    ("orgColor", "orgColor", None),
+)
+
+
+@dataclass(slots=True)
 class ArticleDataDTO:
     eccId: int
     ean: Optional[str] = None
@@ -71,31 +98,17 @@ class ArticleDataDTO:
     @classmethod
     def from_api_response(cls, data: dict[str, Any], ean: str) -> "ArticleDataDTO":
         """Creates ArticleDataDTO from API response with new structure."""
-        # Map API fields to DTO fields
-        mapped_data = {
-            "ean": ean,
-            "eccId": data.get("eccId"),
-            "suGln": data.get("suGln"),
-            "mfGln": data.get("mfGln"),
-            "suArticleNumber": data.get("suArticleNumber"),
-            "mfArticleNumber": data.get("mfArticleNumber"),
-            "brandOriginal": data.get("brand"),
-            "brandCleared": data.get("brand"),
-            "modelName": data.get("model"),
-            "articleName": data.get("articleName"),
-            "currency": data.get("currency"),
-            "seasonName": data.get("seasonTxt"),
-            # Добавленные поля
-            "colorCode": data.get("colorCode"),
-            "colorName": data.get("colorName"),
-            "customsTariffNumber": data.get("customsTariffNumber"),
-            "tax": data.get("tax"),
-            "deliveryFrom": str(data.get("deliveryFrom")) if data.get("deliveryFrom") else None,  # Преобразуем в строку
-            "shoeWidth": data.get("shoeWidth"),
-            "materialName": data.get("materialName"),
-            "innerMaterial": data.get("innerMaterial"),
-            "orgColor": data.get("orgColor"),
-        }
+        # Map API fields to DTO fields, skipping values the API did not send
+        mapped_data = {"ean": ean}
+        for api_key, dto_field, transform in _API_TO_DTO_KEYS:
+            value = data.get(api_key)
+            if value is not None:
+                mapped_data[dto_field] = transform(value) if transform else value
+
+        # Преобразуем в строку
+        delivery_from = data.get("deliveryFrom")
+        if delivery_from:
+            mapped_data["deliveryFrom"] = str(delivery_from)
 
         # Check PRIMARY KEY
         if not mapped_data.get("ean") or not mapped_data.get("suGln"):
@@ -105,7 +118,7 @@ class ArticleDataDTO:
         # Handle season data
         if data.get("season") and isinstance(data["season"], dict):
             mapped_data["seasonEccId"] = data["season"].get("id")
-            mapped_data["seasonName"] = data["season"].get("value")
+            mapped_data["seasonName"] = intern_str(data["season"].get("value"))
 
         # Handle easColor
         if data.get("easColor") and isinstance(data["easColor"], dict):
@@ -141,30 +154,32 @@ class ArticleDataDTO:
                 logger.warning(f"No assortment data found for EAN {ean}")
 
         # Handle images - extract all file URLs from media
-        images = []
+        images = [
+            media_item["file"]
+            for img_group in data.get("images") or ()
+            for media_item in img_group.get("media") or ()
+            if media_item.get("file")
+        ]
 
         # imageNameWwsImport if exist
-        if data.get("imageNameWwsImport"):
-            images.append(data["imageNameWwsImport"])
-
-        if data.get("images"):
-            for img_group in data["images"]:
-                if img_group.get("media"):
-                    for media_item in img_group["media"]:
-                        file_url = media_item.get("file")
-                        if file_url:
-                            images.append(file_url)
+        wws_image = data.get("imageNameWwsImport")
+        if wws_image:
+            images.insert(0, wws_image)
 
         mapped_data["images"] = images
 
-        valid_keys = {f.name for f in dataclasses.fields(cls)}
-        filtered_data = {
-            k: v
-            for k, v in mapped_data.items()
-            if k in valid_keys and (k in ["ean", "suGln", "images"] or v is not None)
-        }
+        # Drop unknown keys and None values in place so the dataclass defaults apply
+        for key in list(mapped_data):
+            if key not in _VALID_KEYS or (mapped_data[key] is None and key not in _ALWAYS_KEEP_KEYS):
+                del mapped_data[key]
+
+        # logger.info(f"Mapped data keys: {list(mapped_data.keys())}")
+        # Lazy %-formatting: this runs once per article and is skipped entirely above INFO
+        logger.info("EAN: %s, suGln: %s", mapped_data["ean"], mapped_data["suGln"])
+
+        return cls(**mapped_data)
 
-        # logger.info(f"Mapped data keys: {list(filtered_data.keys())}")
-        logger.info(f"EAN: {filtered_data.get('ean')}, suGln: {filtered_data.get('suGln')}")
 
-        return cls(**filtered_data)
+# Computed once at import instead of on every from_api_response call
+_VALID_KEYS: frozenset[str] = frozenset(f.name for f in dataclasses.fields(ArticleDataDTO))
+_ALWAYS_KEEP_KEYS: frozenset[str] = frozenset({"ean", "suGln", "images"})
@@ -2,12 +2,11 @@
 
 """Data Transfer Objects for Product Availability data."""
 
-import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SupplierContextDTO:  # Renamed from SupplierRequestDTO for clarity as it's a context, not just a request
     """DTO for supplier identification and retailer context in availability requests."""
 
@@ -18,7 +17,7 @@ class SupplierContextDTO:  # Renamed from SupplierRequestDTO for clarity as it's
     supplier_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GtinStockItemDTO:
     """DTO for a single GTIN's stock information."""
 
@@ -29,9 +28,9 @@ class GtinStockItemDTO:
     timestamp: datetime | None = None  # Added for the exact timestamp from API
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GtinStockResponseDTO:  # Renamed from EANAvailabilityResponseDTO
     """DTO for the response containing a list of GTIN stock items for a given supplier context."""
 
     supplier_context: SupplierContextDTO
-    stock_items: list[GtinStockItemDTO] = field(default_factory=list)
+    stock_items: tuple[GtinStockItemDTO, ...] = ()
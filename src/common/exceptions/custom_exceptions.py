@@ -7,14 +7,15 @@ class ApplicationError(Exception):
     def __init__(
         self, message: str = "An application error occurred", original_exception: Exception | None = None
     ) -> None:
-        super().__init__(message)
+        # Render once here so str(exc) stays a plain attribute read when errors are logged in loops
+        rendered = f"{message} (Original error: {original_exception})" if original_exception else message
+        super().__init__(rendered)
         self.original_exception = original_exception
         self.message = message
+        self._rendered = rendered
 
     def __str__(self) -> str:
-        if self.original_exception:
-            return f"{self.message} (Original error: {self.original_exception})"
-        return self.message
+        return self._rendered
 
 
 class APIError(ApplicationError):
@@ -26,16 +27,15 @@ class APIError(ApplicationError):
         original_exception: Exception | None = None,
         status_code: int | None = None,
     ) -> None:
+        message = f"API Error: {message}"
+        if status_code:
+            message += f" (Status Code: {status_code})"
         super().__init__(message, original_exception)
         self.status_code = status_code
-        self.message = f"API Error: {message}"
-        if status_code:
-            self.message += f" (Status Code: {status_code})"
 
 
 class DatabaseError(ApplicationError):
     """Exception raised for errors during database operations."""
 
     def __init__(self, message: str = "Database operation failed", original_exception: Exception | None = None) -> None:
-        super().__init__(message, original_exception)
-        self.message = f"Database Error: {message}"
+        super().__init__(f"Database Error: {message}", original_exception)
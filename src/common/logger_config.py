@@ -2,16 +2,16 @@
 """Application-wide logging configuration."""
 
 import logging
+import os
 
 from rich.logging import RichHandler
 
 from src.common.config.settings import settings  # Import settings for log level
 
 
-def setup_logging() -> None:
-    """Configures basic logging for the application."""
-    log_level_str = settings.LOG_LEVEL.upper()
-    log_level = getattr(logging, log_level_str, logging.INFO)
+def setup_logging(log_file: str | None = None) -> None:
+    """Configures logging for the application; Rich console output, plus a plain-text file when log_file is given."""
+    log_level = logging.getLevelNamesMapping().get(settings.LOG_LEVEL.upper(), logging.INFO)
 
     # logging.basicConfig(
     #     level=log_level,
@@ -37,10 +37,20 @@ def setup_logging() -> None:
         ],
     )
 
-    root_logger.addHandler(rich_handler)
+    # Replace rather than append, so calling setup_logging again never leaves duplicate handlers
+    handlers: list[logging.Handler] = [rich_handler]
 
-    if len(root_logger.handlers) > 1:
-        root_logger.handlers = [rich_handler]
+    if log_file:
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        handlers.append(file_handler)
+
+    for old_handler in root_logger.handlers:
+        old_handler.close()
+    root_logger.handlers = handlers
 
     # Suppress verbose logging from libraries
     logging.getLogger("mysql.connector").setLevel(logging.WARNING)
@@ -1,26 +1,48 @@
 """Utility functions for date manipulation."""
 
+import re
 from datetime import datetime, date
 
+# Bound once; these run for every article row written to the database
+_datetime_fromisoformat = datetime.fromisoformat
+_date_fromisoformat = date.fromisoformat
+
+# Common API shapes ("2024-01-21T10:00:00Z", "...+00:00", "...123") that map straight onto MySQL format.
+# Days 29-31 are left to fromisoformat so impossible dates (Feb 30) are still rejected.
+_ISO_DATETIME_RE = re.compile(
+    r"((?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8]))[T ]"
+    r"((?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d)(?:\.\d+)?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?",
+    re.ASCII,
+)
+_ISO_DATE_RE = re.compile(r"(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])", re.ASCII)
+
 
 def format_datetime_for_db(dt_str: str) -> str | None:
     """Formats an ISO datetime string for MySQL DATETIME."""
     if not dt_str:
         return None
+    if type(dt_str) is str:
+        match = _ISO_DATETIME_RE.fullmatch(dt_str)
+        if match:
+            return f"{match[1]} {match[2]}"
     try:
-        # Handle both Z and +00:00 for UTC, or local timezone
-        dt_obj = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-        return dt_obj.strftime("%Y-%m-%d %H:%M:%S")
+        # fromisoformat accepts a trailing Z (UTC) as well as +00:00 or a local offset since Python 3.11
+        dt_obj = _datetime_fromisoformat(dt_str)
     except (ValueError, TypeError):
         return None
+    return (
+        f"{dt_obj.year:04d}-{dt_obj.month:02d}-{dt_obj.day:02d} "
+        f"{dt_obj.hour:02d}:{dt_obj.minute:02d}:{dt_obj.second:02d}"
+    )
 
 
 def format_date_for_db(date_str: str) -> str | None:
     """Formats an ISO date string for MySQL DATE."""
     if not date_str:
         return None
+    if type(date_str) is str and _ISO_DATE_RE.fullmatch(date_str):
+        return date_str
     try:
-        date_obj = date.fromisoformat(date_str)
-        return date_obj.strftime("%Y-%m-%d")
+        return _date_fromisoformat(date_str).isoformat()
     except (ValueError, TypeError):
         return None
@@ -0,0 +1,66 @@
+"""Utility functions for MySQL connection management."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
+
+from src.common.config.settings import settings
+from src.common.exceptions.custom_exceptions import DatabaseError
+
+_pool: MySQLConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> MySQLConnectionPool:
+    """Returns the process-wide MySQL connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = MySQLConnectionPool(
+                        pool_name="pds",
+                        pool_size=settings.DB_POOL_SIZE,
+                        pool_reset_session=True,
+                        host=settings.DB_HOST,
+                        database=settings.DB_DATABASE,
+                        user=settings.DB_USER,
+                        password=settings.DB_PASSWORD,
+                        autocommit=False,
+                        charset="utf8mb4",
+                        use_unicode=True,
+                    )
+                except Error as e:
+                    raise DatabaseError(f"Failed to create MySQL connection pool: {e}", original_exception=e)
+    return _pool
+
+
+@contextmanager
+def pooled_connection() -> Iterator[PooledMySQLConnection]:
+    """
+    Borrows a connection from the pool and returns it to the pool when the block exits.
+    The pool raises instead of blocking when it is exhausted, so an exhausted pool is retried with a
+    short backoff for up to DB_POOL_TIMEOUT_SECONDS while other threads hand their connections back.
+    """
+    deadline = time.monotonic() + settings.DB_POOL_TIMEOUT_SECONDS
+    delay = 0.01
+    while True:
+        try:
+            conn = get_connection_pool().get_connection()
+            break
+        except PoolError as e:
+            if time.monotonic() >= deadline:
+                raise DatabaseError(f"Failed to get MySQL connection from pool: {e}", original_exception=e)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        except Error as e:
+            raise DatabaseError(f"Failed to get MySQL connection from pool: {e}", original_exception=e)
+    try:
+        yield conn
+    finally:
+        conn.close()
@@ -0,0 +1,9 @@
+"""Utility functions for string handling."""
+
+import sys
+from typing import Any
+
+
+def intern_str(value: Any) -> Any:
+    """Interns low-cardinality string values (codes, enum-like labels) so repeated rows share one object."""
+    return sys.intern(value) if type(value) is str else value
@@ -2,8 +2,12 @@
 # src/product_availability_domain/application/gtin_stock_service.py
 """Application service for GTIN Stock synchronization with batch processing support."""
 
-import json
+import concurrent.futures
+import functools
 import logging
+import os
+
+import orjson
 
 from src.common.config.settings import settings
 from src.common.dtos.availability_dtos import (
@@ -22,6 +26,48 @@ from src.product_availability_domain.infrastructure.api_clients.global_stock_api
 logger = logging.getLogger(__name__)
 
 
+def load_suppliers_list(suppliers_config_path: str) -> tuple[dict, ...]:
+    """
+    Loads the supplier entries from the suppliers configuration JSON.
+    The parsed result is cached until the file's modification time changes.
+    """
+    try:
+        mtime_ns = os.stat(suppliers_config_path).st_mtime_ns
+    except FileNotFoundError:
+        raise ApplicationError(f"Suppliers configuration file not found at {suppliers_config_path}")
+    return _load_suppliers_list(suppliers_config_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_suppliers_list(suppliers_config_path: str, mtime_ns: int) -> tuple[dict, ...]:  # noqa: ARG001
+    """Parses the suppliers configuration; `mtime_ns` is only part of the cache key."""
+    try:
+        with open(suppliers_config_path, "rb") as f:
+            suppliers_data = orjson.loads(f.read())
+    except FileNotFoundError:
+        raise ApplicationError(f"Suppliers configuration file not found at {suppliers_config_path}")
+    except orjson.JSONDecodeError:
+        raise ApplicationError(f"Error decoding suppliers configuration from {suppliers_config_path}")
+
+    # Handle different JSON structures
+    if isinstance(suppliers_data, dict) and "suppliers" in suppliers_data:
+        return tuple(suppliers_data["suppliers"])
+    if isinstance(suppliers_data, list):
+        return tuple(suppliers_data)
+    raise ApplicationError("Invalid suppliers configuration format")
+
+
+def supplier_context_from_config(supplier_info: dict) -> SupplierContextDTO:
+    """Builds the SupplierContextDTO for one suppliers configuration entry, accepting lower- or upper-case keys."""
+    return SupplierContextDTO(
+        retailer_id=settings.RETAILER_ID,
+        retailer_gln=settings.RETAILER_GLN,
+        supplier_id=supplier_info.get("supplier_id") or supplier_info.get("SUPPLIER_ID"),
+        supplier_gln=supplier_info.get("supplier_gln") or supplier_info.get("SUPPLIER_GLN"),
+        supplier_name=supplier_info.get("supplier_name") or supplier_info.get("SUPPLIER_NAME"),
+    )
+
+
 class GtinStockApplicationService:
     """Service for synchronizing and managing GTIN stock data with optimizations."""
 
@@ -38,64 +84,46 @@ class GtinStockApplicationService:
         Note: This method loads all data before saving. For large datasets,
         consider using sync_all_supplier_stock_optimized instead.
         """
-        logger.info(f"Starting GTIN stock synchronization for all configured suppliers...")
+        logger.info("Starting GTIN stock synchronization for all configured suppliers...")
 
-        try:
-            with open(suppliers_config_path, "r", encoding="utf-8") as f:
-                suppliers_data = json.load(f)
-        except FileNotFoundError:
-            raise ApplicationError(f"Suppliers configuration file not found at {suppliers_config_path}")
-        except json.JSONDecodeError:
-            raise ApplicationError(f"Error decoding suppliers configuration from {suppliers_config_path}")
-
-        # Handle different JSON structures
-        if isinstance(suppliers_data, dict) and "suppliers" in suppliers_data:
-            suppliers_list = suppliers_data["suppliers"]
-        elif isinstance(suppliers_data, list):
-            suppliers_list = suppliers_data
-        else:
-            raise ApplicationError("Invalid suppliers configuration format")
+        suppliers_list = load_suppliers_list(suppliers_config_path)
 
-        for supplier_info in suppliers_list:
-            # Handle different key formats
-            supplier_id = supplier_info.get("supplier_id") or supplier_info.get("SUPPLIER_ID")
-            supplier_gln = supplier_info.get("supplier_gln") or supplier_info.get("SUPPLIER_GLN")
-            supplier_name = supplier_info.get("supplier_name") or supplier_info.get("SUPPLIER_NAME")
-
-            supplier_context = SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=supplier_id,
-                supplier_gln=supplier_gln,
-                supplier_name=supplier_name,
-            )
+        # Suppliers are independent: fetch and save them concurrently, each in its own worker
+        max_workers = max(1, min(settings.STOCK_SYNC_MAX_WORKERS, len(suppliers_list)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._sync_supplier_stock, suppliers_list))
 
-            logger.info(
-                f"\n--- Processing supplier: {supplier_context.supplier_name} (GLN: {supplier_context.supplier_gln}) ---"
-            )
+        logger.info("GTIN stock synchronization for all suppliers finished.")
 
-            try:
-                # Use legacy method that loads all data first
-                stock_response_dto = self.api_client.fetch_gtin_stock_data(supplier_context)
+    def _sync_supplier_stock(self, supplier_info: dict) -> None:
+        """Fetches and saves GTIN stock for one supplier; errors are logged so other suppliers continue."""
+        supplier_context = supplier_context_from_config(supplier_info)
 
-                if not stock_response_dto or not stock_response_dto.stock_items:
-                    logger.warning(f"No GTIN stock data received from API for {supplier_context.supplier_name}.")
-                    continue
+        logger.info(
+            "\n--- Processing supplier: %s (GLN: %s) ---", supplier_context.supplier_name, supplier_context.supplier_gln
+        )
 
-                # Save all items in a single batch for better performance
-                self.stock_repo.batch_save_gtin_stock_items(supplier_context, stock_response_dto.stock_items)
+        try:
+            # Use legacy method that loads all data first
+            stock_response_dto = self.api_client.fetch_gtin_stock_data(
+                supplier_context, skip_gtins=self._get_fresh_gtins(supplier_context)
+            )
 
-                logger.info(
-                    f"GTIN stock synchronization completed for {len(stock_response_dto.stock_items)} items for {supplier_context.supplier_name}."
-                )
+            if not stock_response_dto or not stock_response_dto.stock_items:
+                logger.warning("No GTIN stock data received from API for %s.", supplier_context.supplier_name)
+                return
 
-            except Exception as e:
-                logger.error(f"Error syncing stock for {supplier_context.supplier_name}: {e}")
-                logger.error(f"An error occurred while syncing stock for {supplier_context.supplier_name}: {e}")
-                # Continue with next supplier even if one fails
-                continue
+            # Save all items in a single batch for better performance
+            self.stock_repo.batch_save_gtin_stock_items(supplier_context, stock_response_dto.stock_items)
 
-        logger.info("GTIN stock synchronization for all suppliers finished.")
+            logger.info(
+                "GTIN stock synchronization completed for %s items for %s.",
+                len(stock_response_dto.stock_items),
+                supplier_context.supplier_name,
+            )
+
+        except Exception as e:
+            logger.error("Error syncing stock for %s: %s", supplier_context.supplier_name, e)
 
     def sync_all_supplier_stock_optimized(self, suppliers_config_path: str, batch_size: int = 100) -> None:
         """
@@ -106,64 +134,38 @@ class GtinStockApplicationService:
             suppliers_config_path: Path to suppliers configuration JSON
             batch_size: Number of GTINs to process in each batch
         """
-        logger.info(f"Starting optimized GTIN stock synchronization for all configured suppliers...")
+        logger.info("Starting optimized GTIN stock synchronization for all configured suppliers...")
 
-        try:
-            with open(suppliers_config_path, "r", encoding="utf-8") as f:
-                suppliers_data = json.load(f)
-        except FileNotFoundError:
-            raise ApplicationError(f"Suppliers configuration file not found at {suppliers_config_path}")
-        except json.JSONDecodeError:
-            raise ApplicationError(f"Error decoding suppliers configuration from {suppliers_config_path}")
-
-        # Handle different JSON structures
-        if isinstance(suppliers_data, dict) and "suppliers" in suppliers_data:
-            suppliers_list = suppliers_data["suppliers"]
-        elif isinstance(suppliers_data, list):
-            suppliers_list = suppliers_data
-        else:
-            raise ApplicationError("Invalid suppliers configuration format")
+        suppliers_list = load_suppliers_list(suppliers_config_path)
 
         for supplier_info in suppliers_list:
-            # Handle different key formats
-            supplier_id = supplier_info.get("supplier_id") or supplier_info.get("SUPPLIER_ID")
-            supplier_gln = supplier_info.get("supplier_gln") or supplier_info.get("SUPPLIER_GLN")
-            supplier_name = supplier_info.get("supplier_name") or supplier_info.get("SUPPLIER_NAME")
-
-            supplier_context = SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=supplier_id,
-                supplier_gln=supplier_gln,
-                supplier_name=supplier_name,
-            )
+            supplier_context = supplier_context_from_config(supplier_info)
 
             logger.info(
-                f"\n--- Processing supplier: {supplier_context.supplier_name} (GLN: {supplier_context.supplier_gln}) ---"
+                "\n--- Processing supplier: %s (GLN: %s) ---",
+                supplier_context.supplier_name,
+                supplier_context.supplier_gln,
             )
 
             try:
-                # Define callback for batch saving
-                def batch_save_callback(context: SupplierContextDTO, items: list[GtinStockItemDTO]) -> None:
-                    """Callback to save batches immediately."""
-                    if items:
-                        self.stock_repo.batch_save_gtin_stock_items(context, items)
-
-                # Use optimized API client with batch processing
+                # Use optimized API client with batch processing; the client only saves non-empty batches,
+                # so the repository method serves as the save callback directly
                 stock_response_dto = self.api_client.fetch_gtin_stock_data_optimized(
                     supplier_context=supplier_context,
                     batch_size=batch_size,
                     max_workers=1,  # Sequential processing to respect API limits
-                    save_callback=batch_save_callback,
+                    save_callback=self.stock_repo.batch_save_gtin_stock_items,
+                    skip_gtins=self._get_fresh_gtins(supplier_context),
                 )
 
                 logger.info(
-                    f"Optimized GTIN stock synchronization completed for {len(stock_response_dto.stock_items)} items for {supplier_context.supplier_name}."
+                    "Optimized GTIN stock synchronization completed for %s items for %s.",
+                    len(stock_response_dto.stock_items),
+                    supplier_context.supplier_name,
                 )
 
             except Exception as e:
-                logger.error(f"Error syncing stock for {supplier_context.supplier_name}: {e}")
-                logger.error(f"An error occurred while syncing stock for {supplier_context.supplier_name}: {e}")
+                logger.error("Error syncing stock for %s: %s", supplier_context.supplier_name, e)
                 # Continue with next supplier even if one fails
                 continue
 
@@ -183,19 +185,38 @@ class GtinStockApplicationService:
         Returns:
             GtinStockResponseDTO with all processed items
         """
-        logger.info(f"Starting stock sync for supplier: {supplier_context.supplier_name}")
+        logger.info("Starting stock sync for supplier: %s", supplier_context.supplier_name)
 
-        # Define batch save callback
-        def batch_save_callback(context: SupplierContextDTO, items: list[GtinStockItemDTO]) -> None:
-            """Saves batch and calls progress callback if provided."""
-            if items:
-                self.stock_repo.batch_save_gtin_stock_items(context, items)
-                if progress_callback:
-                    progress_callback(context, len(items))
+        if progress_callback:
+            save_callback = functools.partial(self._save_batch_and_report, progress_callback=progress_callback)
+        else:
+            save_callback = self.stock_repo.batch_save_gtin_stock_items
 
         # Use optimized API client
         return self.api_client.fetch_gtin_stock_data_optimized(
-            supplier_context=supplier_context, batch_size=batch_size, max_workers=1, save_callback=batch_save_callback
+            supplier_context=supplier_context,
+            batch_size=batch_size,
+            max_workers=1,
+            save_callback=save_callback,
+            skip_gtins=self._get_fresh_gtins(supplier_context),
+        )
+
+    def _save_batch_and_report(
+        self, context: SupplierContextDTO, items: list[GtinStockItemDTO], progress_callback: callable
+    ) -> None:
+        """Saves a batch and reports its size to the progress callback."""
+        self.stock_repo.batch_save_gtin_stock_items(context, items)
+        progress_callback(context, len(items))
+
+    def _get_fresh_gtins(self, supplier_context: SupplierContextDTO) -> set[str]:
+        """
+        Returns the supplier's GTINs synced within STOCK_REFRESH_TTL_SECONDS, which need no new API request.
+        Empty when the TTL is disabled (0), so every GTIN is fetched again.
+        """
+        if settings.STOCK_REFRESH_TTL_SECONDS <= 0:
+            return set()
+        return self.stock_repo.get_recently_synced_gtins(
+            supplier_context.supplier_gln, settings.STOCK_REFRESH_TTL_SECONDS
         )
 
     def get_supplier_stock_data(self, supplier_context: SupplierContextDTO) -> GtinStockResponseDTO:
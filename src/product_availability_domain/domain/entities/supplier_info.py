@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)  # Value objects are immutable
+@dataclass(frozen=True, slots=True)  # Value objects are immutable
 class SupplierInfo:
     """Represents the immutable details of a supplier context for availability data."""
 
@@ -27,6 +27,11 @@ class IGtinStockRepository(ABC):
         """Checks which GTIN-Supplier pairs already exist in the database."""
         pass
 
+    @abstractmethod
+    def get_recently_synced_gtins(self, supplier_gln: str, max_age_seconds: int) -> set[str]:
+        """Returns the GTINs of a supplier whose stock was synced within the last `max_age_seconds`."""
+        pass
+
     @abstractmethod
     def get_gtin_stock_by_supplier_context(self, supplier_context: SupplierContextDTO) -> GtinStockResponseDTO:
         """Retrieves all GTIN stock for a given supplier context."""
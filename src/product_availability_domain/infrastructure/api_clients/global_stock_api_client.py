@@ -2,13 +2,13 @@
 """Client for the Global Stock API with batch processing and optimization."""
 
 import concurrent.futures
-import json
+import functools
 import logging
 import time
 from datetime import datetime
-from threading import Lock
 from typing import Optional
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -20,15 +20,36 @@ from src.common.dtos.availability_dtos import (
     SupplierContextDTO,
 )
 from src.common.exceptions.custom_exceptions import APIError
+from src.common.utils.rate_limiter import TokenBucket
+from src.common.utils.string_utils import intern_str
 
 logger = logging.getLogger(__name__)
 
+# Bound once; called for every stock entry returned by the API
+_datetime_fromisoformat = datetime.fromisoformat
+
+# Item types stored for the API's numeric "type" field (1 = pair, anything else = set)
+_ITEM_TYPE_PAIR = "Pair"
+_ITEM_TYPE_SET = "Set"
+
+
+# Entries of one response usually share a handful of timestamps; datetimes are immutable, so reuse is safe
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
+    """Parses an API timestamp; fromisoformat accepts a trailing Z (UTC) since Python 3.11."""
+    return _datetime_fromisoformat(timestamp_str) if timestamp_str else None
+
 
 class GlobalStockApiClient:
     def __init__(self) -> None:
         self.base_url = settings.EAN_AVAILABILITY_API_BASE_URL
         self.token = settings.EAN_AVAILABILITY_API_TOKEN
         self.retailer_gln = settings.RETAILER_GLN
+        self.max_workers = settings.STOCK_API_MAX_WORKERS
+
+        # Constant parts of the per-GTIN availability request, built once instead of on every call
+        self._availability_url_prefix = f"{self.base_url}/supplierStockData/availabilities/"
+        self._availability_base_params = {"retailerGln": self.retailer_gln, "stockType": 1, "token": self.token}
 
         # Configure session with connection pooling and retry strategy
         self.session = requests.Session()
@@ -42,14 +63,23 @@ class GlobalStockApiClient:
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
             pool_connections=20,  # Number of connection pools
-            pool_maxsize=20,  # Maximum number of connections in each pool
+            pool_maxsize=max(20, self.max_workers),  # Maximum number of connections in each pool
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-        # Thread-safe counter for progress tracking
-        self._processed_count = 0
-        self._lock = Lock()
+        # Shared by all worker threads, so the API sees at most STOCK_API_RATE_LIMIT requests per second
+        self._rate_limiter = TokenBucket(rate=settings.STOCK_API_RATE_LIMIT, capacity=settings.STOCK_API_BURST)
+
+    def close(self) -> None:
+        """Closes the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "GlobalStockApiClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def get_gtins_with_stock(self, supplier_gln: str) -> list[str]:
         """
@@ -64,14 +94,14 @@ class GlobalStockApiClient:
         try:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.Timeout as e:
             raise APIError(f"API request for GTINs with stock timed out: {e}")
         except requests.exceptions.RequestException as e:
             raise APIError(
                 f"Error fetching GTINs with stock from API: {e}. Status code: {e.response.status_code if e.response else 'N/A'}"
             )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise APIError(
                 f"Failed to decode API JSON response for GTINs with stock: {e}. Raw response: {response.text if 'response' in locals() else 'N/A'}"
             )
@@ -84,113 +114,141 @@ class GlobalStockApiClient:
         if not self.token:
             raise APIError("EAN_AVAILABILITY_API_TOKEN is not set in environment variables.")
 
-        url = f"{self.base_url}/supplierStockData/availabilities/{gtin}"
-        params = {
-            "supplierGln": supplier_gln,
-            "retailerGln": self.retailer_gln,
-            "stockType": 1,
-            "token": self.token,
-        }
+        url = self._availability_url_prefix + gtin
+        params = {**self._availability_base_params, "supplierGln": supplier_gln}
 
+        self._rate_limiter.acquire()
         try:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.Timeout:
-            logger.warning(f"⏳ Timeout for GTIN {gtin}")
+            logger.warning("⏳ Timeout for GTIN %s", gtin)
             return {}
         except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Error for GTIN {gtin}: {e}")
+            logger.error("❌ Error for GTIN %s: %s", gtin, e)
             return {}
+        except orjson.JSONDecodeError as e:
+            logger.error("❌ Invalid JSON for GTIN %s: %s", gtin, e)
+            return {}
+
+    def _fetch_gtin_stock_items(
+        self, gtin: str, supplier_gln: str, batch_num: int, total_batches: int
+    ) -> list[GtinStockItemDTO]:
+        """Fetches the availability of one GTIN and converts it to stock items."""
+        # Per-GTIN progress is debug-only; the batch summary is logged at INFO by _process_gtin_batch
+        logger.debug("🔄 Batch %s/%s - Processing GTIN %s", batch_num, total_batches, gtin)
+
+        result = self.get_gtin_availability(gtin, supplier_gln)
+
+        if "stocksQueryResult" not in result:
+            return []
+
+        return [
+            GtinStockItemDTO(
+                gtin=entry.get("gtin"),
+                quantity=entry.get("quantity"),
+                stock_traffic_light=intern_str(entry.get("stockTrafficLight")),
+                item_type=_ITEM_TYPE_PAIR if entry.get("type") == 1 else _ITEM_TYPE_SET,
+                timestamp=_parse_timestamp(entry.get("timestamp")),
+            )
+            for entry in result["stocksQueryResult"]
+        ]
 
     def _process_gtin_batch(
         self, gtins_batch: list[str], supplier_gln: str, batch_num: int, total_batches: int
     ) -> list[GtinStockItemDTO]:
         """
         Processes a batch of GTINs and returns the stock items.
-        This method is designed to be called in parallel.
+        Requests are I/O-bound, so up to `max_workers` of them overlap on the pooled session;
+        items keep the order of `gtins_batch`.
         """
         fetched_items: list[GtinStockItemDTO] = []
+        if not gtins_batch:
+            return fetched_items
 
-        for gtin in gtins_batch:
-            with self._lock:
-                self._processed_count += 1
-                current_count = self._processed_count
-
-            logger.info(f"🔄 Batch {batch_num}/{total_batches} - Processing GTIN {current_count}: {gtin}")
-
-            result = self.get_gtin_availability(gtin, supplier_gln)
-
-            if "stocksQueryResult" not in result:
-                continue
-
-            for entry in result["stocksQueryResult"]:
-                # Convert timestamp string to datetime object if it exists
-                timestamp_str = entry.get("timestamp")
-                timestamp_dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00")) if timestamp_str else None
-
-                fetched_items.append(
-                    GtinStockItemDTO(
-                        gtin=entry.get("gtin"),
-                        quantity=entry.get("quantity"),
-                        stock_traffic_light=entry.get("stockTrafficLight"),
-                        item_type="Pair" if entry.get("type") == 1 else "Set",
-                        timestamp=timestamp_dt,
-                    )
-                )
-
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+        max_workers = max(1, min(self.max_workers, len(gtins_batch)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda gtin: self._fetch_gtin_stock_items(gtin, supplier_gln, batch_num, total_batches), gtins_batch
+            )
+            for items in results:
+                fetched_items.extend(items)
 
+        logger.info(
+            "🔄 Batch %s/%s - %s stock items from %s GTINs",
+            batch_num,
+            total_batches,
+            len(fetched_items),
+            len(gtins_batch),
+        )
         return fetched_items
 
+    @staticmethod
+    def _wait_for_save(future: concurrent.futures.Future, batch_num: int, item_count: int) -> None:
+        """Waits for a background batch save and logs its outcome; a failed save does not stop the sync."""
+        try:
+            future.result()
+            logger.info("💾 Saved batch %s (%s items)", batch_num, item_count)
+        except Exception as e:
+            logger.error("⚠️ Failed to save batch %s: %s", batch_num, e)
+
     def fetch_gtin_stock_data_optimized(
         self,
         supplier_context: SupplierContextDTO,
         batch_size: int = 100,
         max_workers: int = 5,
         save_callback: Optional[callable] = None,
+        skip_gtins: Optional[set[str]] = None,
     ) -> GtinStockResponseDTO:
         """
         Optimized version that processes GTINs in batches with optional concurrent processing
-        and periodic saving to prevent data loss.
+        and periodic saving to prevent data loss. GTINs in `skip_gtins` are not requested.
         """
-        logger.info(f"📦 Starting optimized stock query for: {supplier_context.supplier_name}")
+        logger.info("📦 Starting optimized stock query for: %s", supplier_context.supplier_name)
 
         gtins = self.get_gtins_with_stock(supplier_context.supplier_gln)
+        if skip_gtins:
+            listed_gtins = len(gtins)
+            gtins = [gtin for gtin in gtins if gtin not in skip_gtins]
+            logger.info("⏭️ Skipping %s recently synced GTINs", listed_gtins - len(gtins))
         total_gtins = len(gtins)
 
-        logger.info(f"🔍 Fetching article details for {total_gtins} GTINs in batches of {batch_size}...")
+        logger.info("🔍 Fetching article details for %s GTINs in batches of %s...", total_gtins, batch_size)
 
-        # Reset processed counter
-        self._processed_count = 0
         all_fetched_items: list[GtinStockItemDTO] = []
 
-        # Split GTINs into batches
-        gtin_batches = [gtins[i : i + batch_size] for i in range(0, total_gtins, batch_size)]
-        total_batches = len(gtin_batches)
+        # Split GTINs into batches lazily; each slice is only built when its batch is processed
+        gtin_batches = (gtins[i : i + batch_size] for i in range(0, total_gtins, batch_size))
+        total_batches = -(-total_gtins // batch_size)
 
         if max_workers == 1:
-            # Sequential processing for better API rate limiting control
-            for batch_num, batch_gtins in enumerate(gtin_batches, 1):
-                logger.info(f"📝 Processing batch {batch_num}/{total_batches} ({len(batch_gtins)} GTINs)")
+            # Sequential processing for better API rate limiting control. Saves run on one background
+            # thread so the next batch is fetched while the previous one is written; at most one save
+            # is in flight, which bounds the memory held by unsaved batches.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as save_executor:
+                pending_save = None
+                for batch_num, batch_gtins in enumerate(gtin_batches, 1):
+                    logger.info("📝 Processing batch %s/%s (%s GTINs)", batch_num, total_batches, len(batch_gtins))
+
+                    batch_items = self._process_gtin_batch(
+                        batch_gtins, supplier_context.supplier_gln, batch_num, total_batches
+                    )
+                    all_fetched_items.extend(batch_items)
 
-                batch_items = self._process_gtin_batch(
-                    batch_gtins, supplier_context.supplier_gln, batch_num, total_batches
-                )
-                all_fetched_items.extend(batch_items)
+                    # Save intermediate results if callback provided
+                    if save_callback and batch_items:
+                        if pending_save:
+                            self._wait_for_save(*pending_save)
+                        future = save_executor.submit(save_callback, supplier_context, batch_items)
+                        pending_save = (future, batch_num, len(batch_items))
 
-                # Save intermediate results if callback provided
-                if save_callback and batch_items:
-                    try:
-                        save_callback(supplier_context, batch_items)
-                        logger.info(f"💾 Saved batch {batch_num} ({len(batch_items)} items)")
-                    except Exception as e:
-                        logger.error(f"⚠️ Failed to save batch {batch_num}: {e}")
-
-                # Brief pause between batches
-                if batch_num < total_batches:
-                    time.sleep(1)
+                    # Brief pause between batches
+                    if batch_num < total_batches:
+                        time.sleep(1)
+
+                if pending_save:
+                    self._wait_for_save(*pending_save)
         else:
             # Concurrent processing (use with caution to not overwhelm API)
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -211,28 +269,28 @@ class GlobalStockApiClient:
                         if save_callback and batch_items:
                             try:
                                 save_callback(supplier_context, batch_items)
-                                logger.info(f"💾 Saved batch {batch_num} ({len(batch_items)} items)")
+                                logger.info("💾 Saved batch %s (%s items)", batch_num, len(batch_items))
                             except Exception as e:
-                                logger.error(f"⚠️ Failed to save batch {batch_num}: {e}")
+                                logger.error("⚠️ Failed to save batch %s: %s", batch_num, e)
 
                     except Exception as exc:
-                        logger.error(f"❌ Batch {batch_num} generated an exception: {exc}")
+                        logger.error("❌ Batch %s generated an exception: %s", batch_num, exc)
 
         logger.info(
-            f"✅ Stock query completed. Processed {total_gtins} GTINs, found {len(all_fetched_items)} stock items."
+            "✅ Stock query completed. Processed %s GTINs, found %s stock items.", total_gtins, len(all_fetched_items)
         )
-        return GtinStockResponseDTO(supplier_context=supplier_context, stock_items=all_fetched_items)
+        return GtinStockResponseDTO(supplier_context=supplier_context, stock_items=tuple(all_fetched_items))
 
-    def fetch_gtin_stock_data(self, supplier_context: SupplierContextDTO) -> GtinStockResponseDTO:
+    def fetch_gtin_stock_data(
+        self, supplier_context: SupplierContextDTO, skip_gtins: Optional[set[str]] = None
+    ) -> GtinStockResponseDTO:
         """
         Legacy method for backward compatibility.
         Now delegates to the optimized version with default parameters.
         """
         return self.fetch_gtin_stock_data_optimized(
-            supplier_context=supplier_context, batch_size=100, max_workers=1  # Sequential processing by default
+            supplier_context=supplier_context,
+            batch_size=100,
+            max_workers=1,  # Sequential processing by default
+            skip_gtins=skip_gtins,
         )
-
-    def __del__(self) -> None:
-        """Clean up the session when the object is destroyed."""
-        if hasattr(self, "session"):
-            self.session.close()
@@ -2,50 +2,128 @@
 # src/product_availability_domain/mysql_gtin_stock_repository
 """MySQL implementation of GTIN Stock repository."""
 
+import functools
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
 
-from src.common.config.settings import settings
 from src.common.dtos.availability_dtos import (
     GtinStockItemDTO,
     GtinStockResponseDTO,
     SupplierContextDTO,
 )
 from src.common.exceptions.custom_exceptions import DatabaseError
+from src.common.utils.db_utils import pooled_connection
 from src.product_availability_domain.domain.repositories.gtin_stock_repository import (
     IGtinStockRepository,
 )
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for (gtin, supplier_gln) pairs in one IN (...) lookup, keeps the statement well below max_allowed_packet
+MAX_PAIRS_PER_QUERY = 1000
+
+
+@functools.lru_cache(maxsize=32)
+def _existing_pairs_sql(pair_count: int) -> str:
+    """Builds the existence lookup for `pair_count` (gtin, supplier_gln) pairs."""
+    placeholders = ",".join(["(%s, %s)"] * pair_count)
+    return f"SELECT gtin, supplier_gln FROM pds_gtin_stock WHERE (gtin, supplier_gln) IN ({placeholders})"
+
 
 class MySQLGtinStockRepository(IGtinStockRepository):
-    """MySQL implementation of the GTIN Stock Repository."""
+    """MySQL implementation of the GTIN Stock Repository. Connections are borrowed from the shared pool."""
 
-    def __init__(self) -> None:
-        """Initializes the repository."""
-        self._connection = None
+    # Rows per executemany in batch_save_gtin_stock_items, i.e. per rewritten multi-row INSERT
+    CHUNK_ROWS = 1000
 
-    def _get_connection(self):
-        """Establishes or returns an active MySQL database connection."""
-        if not self._connection or not self._connection.is_connected():
-            try:
-                self._connection = mysql.connector.connect(
-                    host=settings.DB_HOST,
-                    database=settings.DB_DATABASE,
-                    user=settings.DB_USER,
-                    password=settings.DB_PASSWORD,
-                    autocommit=False,  # Better control over transactions
-                    charset="utf8mb4",
-                    use_unicode=True,
-                )
-            except Error as e:
-                raise DatabaseError(f"Failed to connect to MySQL: {e}", original_exception=e)
-        return self._connection
+    # Removed retailer fields from the query. A single-row VALUES clause lets mysql-connector rewrite
+    # executemany into one multi-row INSERT ... ON DUPLICATE KEY UPDATE per chunk.
+    _UPSERT_SQL = """
+        INSERT INTO pds_gtin_stock
+        (supplier_id, supplier_gln, supplier_name, gtin, quantity, stock_traffic_light, item_type, timestamp)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+        quantity = VALUES(quantity),
+        stock_traffic_light = VALUES(stock_traffic_light),
+        item_type = VALUES(item_type),
+        timestamp = VALUES(timestamp),
+        date_synced = CURRENT_TIMESTAMP
+        """
+    _RECENTLY_SYNCED_SQL = """
+        SELECT gtin
+        FROM pds_gtin_stock
+        WHERE supplier_gln = %s AND date_synced >= NOW() - INTERVAL %s SECOND
+        """
+    _SELECT_BY_SUPPLIER_SQL = """
+        SELECT gtin, quantity, stock_traffic_light, item_type, timestamp
+        FROM pds_gtin_stock
+        WHERE supplier_gln = %s
+        """
+    _SELECT_BY_GTIN_AND_SUPPLIER_SQL = """
+        SELECT gtin, quantity, stock_traffic_light, item_type, timestamp
+        FROM pds_gtin_stock
+        WHERE gtin = %s AND supplier_gln = %s
+        LIMIT 1
+        """
+    _DISTINCT_GTINS_SQL = "SELECT DISTINCT gtin FROM pds_gtin_stock WHERE gtin IS NOT NULL AND gtin != ''"
+    _DISTINCT_SUPPLIER_GLNS_SQL = (
+        "SELECT DISTINCT supplier_gln FROM pds_gtin_stock WHERE supplier_gln IS NOT NULL AND supplier_gln != ''"
+    )
+    _DISTINCT_SUPPLIER_GTIN_PAIRS_SQL = (
+        "SELECT DISTINCT supplier_gln, gtin FROM pds_gtin_stock "
+        "WHERE supplier_gln IS NOT NULL AND supplier_gln != '' AND gtin IS NOT NULL AND gtin != ''"
+    )
+
+    # Covers the DISTINCT supplier_gln, gtin scan; added by create_tables to new and existing tables alike
+    _SUPPLIER_GTIN_INDEX = "idx_supplier_gtin"
+    _SUPPLIER_GTIN_INDEX_EXISTS_SQL = (
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'pds_gtin_stock' AND INDEX_NAME = %s LIMIT 1"
+    )
+    # Other processes (e.g. a concurrent step1 run) can write too; their changes are picked up after this long
+    _DISTINCT_CACHE_TTL_SECONDS = 60.0
+
+    def __init__(self) -> None:
+        # Results of the DISTINCT getters, tagged with the write generation and time they were read at.
+        # Saves through this repository bump the generation, so cached values never outlive a local write;
+        # writes by other processes are only seen once the entry is older than _DISTINCT_CACHE_TTL_SECONDS.
+        self._cache_lock = threading.Lock()
+        self._write_generation = 0
+        self._distinct_cache: dict[str, tuple[int, float, tuple]] = {}
+
+    def _invalidate_distinct_cache(self) -> None:
+        """Marks all cached DISTINCT results as stale after a write."""
+        with self._cache_lock:
+            self._write_generation += 1
+            self._distinct_cache.clear()
+
+    def _cached_distinct(self, key: str, load: Callable[[], list]) -> list:
+        """
+        Returns the cached result for `key`, running `load` when nothing was cached since the last local write
+        or the cached entry is older than _DISTINCT_CACHE_TTL_SECONDS.
+        """
+        with self._cache_lock:
+            generation = self._write_generation
+            cached = self._distinct_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and time.monotonic() - cached[1] < self._DISTINCT_CACHE_TTL_SECONDS
+        ):
+            return list(cached[2])
+
+        loaded_at = time.monotonic()
+        values = load()
+        with self._cache_lock:
+            # A write that finished while loading may not be reflected in `values`; don't cache them then
+            if self._write_generation == generation:
+                self._distinct_cache[key] = (generation, loaded_at, tuple(values))
+        return values
 
     def create_tables(self) -> None:
         """Creates or updates tables for the GTIN Stock domain with 'pds_' prefix."""
@@ -68,80 +146,40 @@ class MySQLGtinStockRepository(IGtinStockRepository):
             INDEX idx_gtin_supplier_composite (gtin, supplier_gln) -- Composite index for faster lookups
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(create_gtin_stock_table_query)
+                conn.commit()
+                logger.info("PDS GTIN Stock table checked/created.")
+                self._ensure_supplier_gtin_index(cursor)
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error creating PDS GTIN Stock table: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    def _ensure_supplier_gtin_index(self, cursor) -> None:
+        """Adds idx_supplier_gtin (supplier_gln, gtin) to pds_gtin_stock unless it already exists."""
+        cursor.execute(self._SUPPLIER_GTIN_INDEX_EXISTS_SQL, (self._SUPPLIER_GTIN_INDEX,))
+        if cursor.fetchall():
+            return
         try:
-            cursor.execute(create_gtin_stock_table_query)
-            conn.commit()
-            logger.info("PDS GTIN Stock table checked/created.")
+            cursor.execute(f"ALTER TABLE pds_gtin_stock ADD INDEX {self._SUPPLIER_GTIN_INDEX} (supplier_gln, gtin)")
         except Error as e:
-            conn.rollback()
-            raise DatabaseError(f"Error creating PDS GTIN Stock table: {e}", original_exception=e)
-        finally:
-            cursor.close()
+            # Another process added the index between the lookup and the ALTER
+            if e.errno != errorcode.ER_DUP_KEYNAME:
+                raise
+            logger.info(f"Index {self._SUPPLIER_GTIN_INDEX} on pds_gtin_stock was added concurrently.")
+            return
+        logger.info(f"Added index {self._SUPPLIER_GTIN_INDEX} on pds_gtin_stock.")
 
     def save_gtin_stock_item(self, supplier_context: SupplierContextDTO, item: GtinStockItemDTO) -> None:
         """Saves or updates a single GTIN stock item with its supplier context."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Removed retailer fields from the query
-        insert_query = """
-        INSERT INTO pds_gtin_stock
-        (supplier_id, supplier_gln, supplier_name, gtin, quantity, stock_traffic_light, item_type, timestamp)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-        quantity = VALUES(quantity),
-        stock_traffic_light = VALUES(stock_traffic_light),
-        item_type = VALUES(item_type),
-        timestamp = VALUES(timestamp),
-        date_synced = CURRENT_TIMESTAMP
-        """
-        params = (
-            supplier_context.supplier_id,
-            supplier_context.supplier_gln,
-            supplier_context.supplier_name,
-            item.gtin,
-            item.quantity,
-            item.stock_traffic_light,
-            item.item_type,
-            item.timestamp,
-        )
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(insert_query, params)
-            conn.commit()
-        except Error as e:
-            conn.rollback()
-            raise DatabaseError(f"Error saving GTIN stock for {item.gtin}: {e}", original_exception=e)
-        finally:
-            cursor.close()
-
-    def batch_save_gtin_stock_items(self, supplier_context: SupplierContextDTO, items: list[GtinStockItemDTO]) -> None:
-        """
-        Batch saves multiple GTIN stock items for better performance.
-        Uses executemany for better performance with large datasets.
-        """
-        if not items:
-            return
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        insert_query = """
-        INSERT INTO pds_gtin_stock
-        (supplier_id, supplier_gln, supplier_name, gtin, quantity, stock_traffic_light, item_type, timestamp)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-        quantity = VALUES(quantity),
-        stock_traffic_light = VALUES(stock_traffic_light),
-        item_type = VALUES(item_type),
-        timestamp = VALUES(timestamp),
-        date_synced = CURRENT_TIMESTAMP
-        """
-
-        params_list = [
-            (
+            params = (
                 supplier_context.supplier_id,
                 supplier_context.supplier_gln,
                 supplier_context.supplier_name,
@@ -151,165 +189,223 @@ class MySQLGtinStockRepository(IGtinStockRepository):
                 item.item_type,
                 item.timestamp,
             )
-            for item in items
-        ]
 
-        try:
-            cursor.executemany(insert_query, params_list)
-            conn.commit()
-            logger.info(f"Batch saved {len(items)} GTIN stock items for supplier {supplier_context.supplier_name}")
-        except Error as e:
-            conn.rollback()
-            raise DatabaseError(f"Error batch saving GTIN stock items: {e}", original_exception=e)
-        finally:
-            cursor.close()
+            try:
+                cursor.execute(self._UPSERT_SQL, params)
+                conn.commit()
+                self._invalidate_distinct_cache()
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error saving GTIN stock for {item.gtin}: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    def batch_save_gtin_stock_items(
+        self, supplier_context: SupplierContextDTO, items: list[GtinStockItemDTO], chunk_size: Optional[int] = None
+    ) -> None:
+        """
+        Batch saves multiple GTIN stock items for better performance.
+        Uses executemany in chunks of `chunk_size` rows (CHUNK_ROWS by default; one multi-row INSERT each)
+        and commits once.
+        """
+        if not items:
+            return
+        chunk_size = chunk_size or self.CHUNK_ROWS
+
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            params_list = [
+                (
+                    supplier_context.supplier_id,
+                    supplier_context.supplier_gln,
+                    supplier_context.supplier_name,
+                    item.gtin,
+                    item.quantity,
+                    item.stock_traffic_light,
+                    item.item_type,
+                    item.timestamp,
+                )
+                for item in items
+            ]
 
-    def check_existing_gtin_supplier_pairs(self, gtin_supplier_pairs: list[tuple[str, str]]) -> set[tuple[str, str]]:
+            try:
+                for start in range(0, len(params_list), chunk_size):
+                    cursor.executemany(self._UPSERT_SQL, params_list[start : start + chunk_size])
+                conn.commit()
+                self._invalidate_distinct_cache()
+                logger.info(f"Batch saved {len(items)} GTIN stock items for supplier {supplier_context.supplier_name}")
+            except Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Error batch saving GTIN stock items: {e}", original_exception=e)
+            finally:
+                cursor.close()
+
+    def check_existing_gtin_supplier_pairs(
+        self, gtin_supplier_pairs: list[tuple[str, str]], chunk_size: int = MAX_PAIRS_PER_QUERY
+    ) -> set[tuple[str, str]]:
         """
         Checks which GTIN-Supplier pairs already exist in the database.
         Returns a set of existing pairs for quick lookup.
+        Pairs are queried in chunks of `chunk_size`, so each statement stays small and full chunks share one SQL text.
         """
-        if not gtin_supplier_pairs:
+        unique_pairs = list(dict.fromkeys(gtin_supplier_pairs))
+        if not unique_pairs:
             return set()
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        existing_pairs: set[tuple[str, str]] = set()
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            # Create placeholders for the IN clause
-            placeholders = ",".join(["(%s, %s)"] * len(gtin_supplier_pairs))
-            query = f"""
-            SELECT gtin, supplier_gln
-            FROM pds_gtin_stock
-            WHERE (gtin, supplier_gln) IN ({placeholders})
-            """
-
-            # Flatten the list of tuples for the query parameters
-            params = [item for pair in gtin_supplier_pairs for item in pair]
+            try:
+                for start in range(0, len(unique_pairs), chunk_size):
+                    chunk = unique_pairs[start : start + chunk_size]
+                    # Flatten the list of tuples for the query parameters
+                    params = [item for pair in chunk for item in pair]
+                    cursor.execute(_existing_pairs_sql(len(chunk)), params)
+                    existing_pairs.update((row[0], row[1]) for row in cursor.fetchall())
+                return existing_pairs
 
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+            except Error as e:
+                raise DatabaseError(f"Error checking existing GTIN-Supplier pairs: {e}", original_exception=e)
+            finally:
+                cursor.close()
 
-            return {(row[0], row[1]) for row in results}
+    def get_recently_synced_gtins(self, supplier_gln: str, max_age_seconds: int) -> set[str]:
+        """
+        Returns the GTINs of a supplier whose stock was synced within the last `max_age_seconds`.
+        One indexed query per supplier; the age is compared on the server so no time zone conversion is needed.
+        """
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
 
-        except Error as e:
-            raise DatabaseError(f"Error checking existing GTIN-Supplier pairs: {e}", original_exception=e)
-        finally:
-            cursor.close()
+            try:
+                cursor.execute(self._RECENTLY_SYNCED_SQL, (supplier_gln, max_age_seconds))
+                return {row[0] for row in cursor.fetchall()}
+            except Error as e:
+                raise DatabaseError(
+                    f"Error fetching recently synced GTINs for supplier GLN {supplier_gln}: {e}", original_exception=e
+                )
+            finally:
+                cursor.close()
 
-    def get_gtin_stock_by_supplier_context(self, supplier_context: SupplierContextDTO) -> GtinStockResponseDTO:
-        """Retrieves all GTIN stock for a given supplier context (retailer context removed from DB)."""
-        conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
+    def get_gtin_stock_by_supplier_context(
+        self, supplier_context: SupplierContextDTO, fetch_size: int = 5000
+    ) -> GtinStockResponseDTO:
+        """
+        Retrieves all GTIN stock for a given supplier context (retailer context removed from DB).
+        Rows are streamed with an unbuffered cursor and converted `fetch_size` at a time, so the full
+        result set is never held as raw rows and DTOs at once.
+        """
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
 
-        stock_items: list[GtinStockItemDTO] = []
+            try:
+                cursor.execute(self._SELECT_BY_SUPPLIER_SQL, (supplier_context.supplier_gln,))
+
+                stock_items: list[GtinStockItemDTO] = []
+                while True:
+                    rows = cursor.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    stock_items.extend(
+                        GtinStockItemDTO(
+                            gtin=row["gtin"],
+                            quantity=row["quantity"],
+                            stock_traffic_light=row["stock_traffic_light"],
+                            item_type=row["item_type"],
+                            timestamp=row["timestamp"],
+                        )
+                        for row in rows
+                    )
+
+                return GtinStockResponseDTO(supplier_context=supplier_context, stock_items=tuple(stock_items))
 
-        try:
-            query = """
-            SELECT gtin, quantity, stock_traffic_light, item_type, timestamp
-            FROM pds_gtin_stock
-            WHERE supplier_gln = %s
-            """
-            cursor.execute(query, (supplier_context.supplier_gln,))
-            rows = cursor.fetchall()
-
-            stock_items = [
-                GtinStockItemDTO(
-                    gtin=row["gtin"],
-                    quantity=row["quantity"],
-                    stock_traffic_light=row["stock_traffic_light"],
-                    item_type=row["item_type"],
-                    timestamp=row["timestamp"],
+            except Error as e:
+                raise DatabaseError(
+                    f"Error fetching GTIN stock by supplier GLN {supplier_context.supplier_gln}: {e}",
+                    original_exception=e,
                 )
-                for row in rows
-            ]
-
-            return GtinStockResponseDTO(supplier_context=supplier_context, stock_items=stock_items)
-
-        except Error as e:
-            raise DatabaseError(
-                f"Error fetching GTIN stock by supplier GLN {supplier_context.supplier_gln}: {e}", original_exception=e
-            )
-        finally:
-            cursor.close()
+            finally:
+                # Rows left unread after an error must be drained before the connection is reused
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
 
     def get_gtin_stock_by_gtin_and_supplier(self, gtin: str, supplier_gln: str) -> Optional[GtinStockItemDTO]:
         """Retrieves a specific GTIN stock item by GTIN and supplier GLN."""
-        conn = self._get_connection()
-        cursor = conn.cursor(dictionary=True)
-        item_dto = None
-        try:
-            query = """
-            SELECT gtin, quantity, stock_traffic_light, item_type, timestamp
-            FROM pds_gtin_stock
-            WHERE gtin = %s AND supplier_gln = %s
-            LIMIT 1
-            """
-            cursor.execute(query, (gtin, supplier_gln))
-            row = cursor.fetchone()
-            if row:
-                item_dto = GtinStockItemDTO(
-                    gtin=row["gtin"],
-                    quantity=row["quantity"],
-                    stock_traffic_light=row["stock_traffic_light"],
-                    item_type=row["item_type"],
-                    timestamp=row["timestamp"],
+        with pooled_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            item_dto = None
+            try:
+                cursor.execute(self._SELECT_BY_GTIN_AND_SUPPLIER_SQL, (gtin, supplier_gln))
+                row = cursor.fetchone()
+                if row:
+                    item_dto = GtinStockItemDTO(
+                        gtin=row["gtin"],
+                        quantity=row["quantity"],
+                        stock_traffic_light=row["stock_traffic_light"],
+                        item_type=row["item_type"],
+                        timestamp=row["timestamp"],
+                    )
+            except Error as e:
+                raise DatabaseError(
+                    f"Error fetching GTIN stock for GTIN {gtin}, Supplier GLN {supplier_gln}: {e}", original_exception=e
                 )
-        except Error as e:
-            raise DatabaseError(
-                f"Error fetching GTIN stock for GTIN {gtin}, Supplier GLN {supplier_gln}: {e}", original_exception=e
-            )
-        finally:
-            cursor.close()
-        return item_dto
+            finally:
+                cursor.close()
+            return item_dto
 
     def get_all_gtin_codes(self) -> list[str]:
         """Retrieves all unique GTIN codes from pds_gtin_stock table."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached_distinct("get_all_gtin_codes", self._load_all_gtin_codes)
 
-        try:
-            cursor.execute("SELECT DISTINCT gtin FROM pds_gtin_stock WHERE gtin IS NOT NULL AND gtin != ''")
-            results = cursor.fetchall()
-            return [row[0] for row in results]
-        except Error as e:
-            raise DatabaseError(f"Error fetching GTIN codes: {e}", original_exception=e)
-        finally:
-            cursor.close()
+    def _load_all_gtin_codes(self) -> list[str]:
+        """Queries the distinct GTIN codes."""
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(self._DISTINCT_GTINS_SQL)
+                results = cursor.fetchall()
+                return [row[0] for row in results]
+            except Error as e:
+                raise DatabaseError(f"Error fetching GTIN codes: {e}", original_exception=e)
+            finally:
+                cursor.close()
 
     def get_unique_supplier_glns(self) -> list[str]:
         """Retrieves all unique supplier GLNs from pds_gtin_stock table."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached_distinct("get_unique_supplier_glns", self._load_unique_supplier_glns)
 
-        try:
-            cursor.execute(
-                "SELECT DISTINCT supplier_gln FROM pds_gtin_stock WHERE supplier_gln IS NOT NULL AND supplier_gln != ''"
-            )
-            results = cursor.fetchall()
-            return [row[0] for row in results]
-        except Error as e:
-            raise DatabaseError(f"Error fetching supplier GLNs: {e}", original_exception=e)
-        finally:
-            cursor.close()
+    def _load_unique_supplier_glns(self) -> list[str]:
+        """Queries the distinct supplier GLNs."""
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(self._DISTINCT_SUPPLIER_GLNS_SQL)
+                results = cursor.fetchall()
+                return [row[0] for row in results]
+            except Error as e:
+                raise DatabaseError(f"Error fetching supplier GLNs: {e}", original_exception=e)
+            finally:
+                cursor.close()
 
     def get_all_supplier_gtin_pairs(self) -> list[tuple[str, str]]:
         """Retrieves all unique supplier_gln and gtin pairs."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached_distinct("get_all_supplier_gtin_pairs", self._load_all_supplier_gtin_pairs)
 
-        try:
-            cursor.execute(
-                "SELECT DISTINCT supplier_gln, gtin FROM pds_gtin_stock WHERE supplier_gln IS NOT NULL AND supplier_gln != '' AND gtin IS NOT NULL AND gtin != ''"
-            )
-            results = cursor.fetchall()
-            return [(row[0], row[1]) for row in results]
-        except Error as e:
-            raise DatabaseError(f"Error fetching all supplier GLN and GTIN pairs: {e}", original_exception=e)
-        finally:
-            cursor.close()
-
-    def __del__(self) -> None:
-        """Closes the database connection when the object is destroyed."""
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
+    def _load_all_supplier_gtin_pairs(self) -> list[tuple[str, str]]:
+        """Queries the distinct supplier_gln and gtin pairs; served by idx_supplier_gtin."""
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(self._DISTINCT_SUPPLIER_GTIN_PAIRS_SQL)
+                results = cursor.fetchall()
+                return [(row[0], row[1]) for row in results]
+            except Error as e:
+                raise DatabaseError(f"Error fetching all supplier GLN and GTIN pairs: {e}", original_exception=e)
+            finally:
+                cursor.close()
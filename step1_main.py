@@ -1,7 +1,6 @@
 # main.py
 """Main application entry point for GTIN Stock synchronization with optimizations."""
 
-import json
 import logging
 import os
 import time
@@ -11,7 +10,7 @@ import pytz
 import schedule
 
 from src.common.config.settings import settings
-from src.common.dtos.availability_dtos import GtinStockItemDTO, SupplierContextDTO
+from src.common.dtos.availability_dtos import SupplierContextDTO
 from src.common.exceptions.custom_exceptions import (
     APIError,
     ApplicationError,
@@ -22,6 +21,8 @@ from src.common.logger_config import setup_logging
 # Product Availability Domain Imports (GTIN Stock)
 from src.product_availability_domain.application.gtin_stock_service import (
     GtinStockApplicationService,
+    load_suppliers_list,
+    supplier_context_from_config,
 )
 from src.product_availability_domain.infrastructure.api_clients.global_stock_api_client import (
     GlobalStockApiClient,
@@ -45,62 +46,24 @@ def setup_gtin_stock_dependencies() -> tuple[GtinStockApplicationService, MySQLG
     return gtin_stock_app_service, gtin_stock_repository
 
 
-def create_gtin_stock_db_tables() -> None:
-    """Creates tables for the GTIN Stock domain."""
-    gtin_stock_repo = MySQLGtinStockRepository()
+def create_gtin_stock_db_tables(gtin_stock_repo: MySQLGtinStockRepository) -> None:
+    """Creates tables for the GTIN Stock domain using the repository the sync will reuse."""
     try:
         gtin_stock_repo.create_tables()
         logger.info("✅ Database tables created/verified successfully")
     except DatabaseError as e:
         logger.error(f"❌ Error creating GTIN Stock database tables: {e}")
         raise  # Re-raise if table creation is critical
-    finally:
-        # Ensure connection is closed if not managed by a connection pool
-        del gtin_stock_repo
-
-
-def load_suppliers_config(config_path: str) -> list[dict]:
-    """Loads and validates suppliers configuration from JSON file."""
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            suppliers_data = json.load(f)
-
-        # Handle different JSON structures
-        if isinstance(suppliers_data, dict) and "suppliers" in suppliers_data:
-            suppliers_list = suppliers_data["suppliers"]
-        elif isinstance(suppliers_data, list):
-            suppliers_list = suppliers_data
-        else:
-            raise ApplicationError("Invalid suppliers configuration format")
-
-        if not suppliers_list:
-            raise ApplicationError("No suppliers found in configuration")
-
-        return suppliers_list
-
-    except FileNotFoundError:
-        raise ApplicationError(f"Suppliers configuration file not found at {config_path}")
-    except json.JSONDecodeError as e:
-        raise ApplicationError(f"Error decoding suppliers configuration: {e}")
 
 
 def create_supplier_context(supplier_data: dict) -> SupplierContextDTO:
     """Creates SupplierContextDTO from supplier configuration data."""
-    # Handle different possible key formats in the JSON
-    supplier_id = supplier_data.get("supplier_id") or supplier_data.get("SUPPLIER_ID")
-    supplier_gln = supplier_data.get("supplier_gln") or supplier_data.get("SUPPLIER_GLN")
-    supplier_name = supplier_data.get("supplier_name") or supplier_data.get("SUPPLIER_NAME")
+    supplier_context = supplier_context_from_config(supplier_data)
 
-    if not all([supplier_id, supplier_gln, supplier_name]):
+    if not all([supplier_context.supplier_id, supplier_context.supplier_gln, supplier_context.supplier_name]):
         raise ApplicationError(f"Missing required supplier fields in config: {supplier_data}")
 
-    return SupplierContextDTO(
-        retailer_id=settings.RETAILER_ID,
-        retailer_gln=settings.RETAILER_GLN,
-        supplier_id=supplier_id,
-        supplier_gln=supplier_gln,
-        supplier_name=supplier_name,
-    )
+    return supplier_context
 
 
 def run_gtin_stock_sync_process_optimized() -> None:
@@ -117,13 +80,17 @@ def run_gtin_stock_sync_process_optimized() -> None:
     logger.info(f"📅 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info(f"{'='*80}")
 
+    # Initialize dependencies; the API client's pooled session is closed once the run ends
+    gtin_stock_app_service, gtin_stock_repository = setup_gtin_stock_dependencies()
+
     try:
-        # Initialize database and dependencies
-        create_gtin_stock_db_tables()
-        gtin_stock_app_service, gtin_stock_repository = setup_gtin_stock_dependencies()
+        # Initialize database
+        create_gtin_stock_db_tables(gtin_stock_repository)
 
         # Load suppliers configuration
-        suppliers_list = load_suppliers_config(SUPPLIERS_CONFIG_PATH)
+        suppliers_list = load_suppliers_list(SUPPLIERS_CONFIG_PATH)
+        if not suppliers_list:
+            raise ApplicationError("No suppliers found in configuration")
         logger.info(f"📋 Loaded {len(suppliers_list)} suppliers from configuration")
 
         total_processed_items = 0
@@ -134,36 +101,29 @@ def run_gtin_stock_sync_process_optimized() -> None:
             try:
                 supplier_context = create_supplier_context(supplier_data)
 
-                logger.info(f"\n{'─'*60}")
                 logger.info(
-                    f"🏭 Processing supplier {supplier_index}/{len(suppliers_list)}: {supplier_context.supplier_name}"
+                    "🏭 Processing supplier %s/%s: %s (GLN: %s)",
+                    supplier_index,
+                    len(suppliers_list),
+                    supplier_context.supplier_name,
+                    supplier_context.supplier_gln,
                 )
-                logger.info(f"   GLN: {supplier_context.supplier_gln}")
-                logger.info(f"{'─'*60}")
-
-                # Define batch save callback for intermediate saves
-                def batch_save_callback(context: SupplierContextDTO, items: list[GtinStockItemDTO]) -> None:
-                    """Callback to save batches immediately for data persistence and fault tolerance."""
-                    if items:
-                        gtin_stock_repository.batch_save_gtin_stock_items(context, items)
-
-                # Use optimized API client with batch processing and intermediate saves
-                stock_response = gtin_stock_app_service.api_client.fetch_gtin_stock_data_optimized(
-                    supplier_context=supplier_context,
+
+                # Batch processing with intermediate saves; GTINs synced within STOCK_REFRESH_TTL_SECONDS are skipped
+                stock_response = gtin_stock_app_service.sync_supplier_stock_with_callback(
+                    supplier_context,
                     batch_size=100,  # Process 100 GTINs at a time for optimal performance
-                    max_workers=1,  # Sequential processing to respect API rate limits
-                    save_callback=batch_save_callback,  # Save each batch immediately
                 )
 
                 supplier_items_count = len(stock_response.stock_items)
                 total_processed_items += supplier_items_count
                 successful_suppliers += 1
 
-                logger.info(f"✅ Completed {supplier_context.supplier_name}: {supplier_items_count} items processed")
+                logger.info("✅ Completed %s: %s items processed", supplier_context.supplier_name, supplier_items_count)
 
             except Exception as e:  # noqa: PERF203
                 failed_suppliers += 1
-                logger.error(f"❌ Failed to process supplier {supplier_data.get('supplier_name', 'Unknown')}: {e}")
+                logger.error("❌ Failed to process supplier %s: %s", supplier_data.get("supplier_name", "Unknown"), e)
                 # Continue with next supplier even if one fails
                 continue
 
@@ -184,6 +144,8 @@ def run_gtin_stock_sync_process_optimized() -> None:
     except Exception as e:
         logger.error(f"💥 Critical error during synchronization: {e}")
         raise
+    finally:
+        gtin_stock_app_service.api_client.close()
 
 
 def display_sample_data(gtin_stock_app_service: GtinStockApplicationService) -> None:
@@ -209,20 +171,23 @@ def display_sample_data(gtin_stock_app_service: GtinStockApplicationService) ->
 
             fetched_stock = gtin_stock_app_service.get_supplier_stock_data(sample_context)
 
-            logger.info(f"📋 Sample from GLN: {sample_gln}")
-            logger.info(f"📦 Total items for this supplier: {len(fetched_stock.stock_items)}")
+            logger.info("📋 Sample from GLN: %s", sample_gln)
+            logger.info("📦 Total items for this supplier: %s", len(fetched_stock.stock_items))
 
-            # Display first 3 items as sample
+            # Display first 3 items as sample, one line per item
             for i, item in enumerate(fetched_stock.stock_items[:3], 1):
-                logger.info(f"   {i}. GTIN: {item.gtin}")
-                logger.info(f"      Quantity: {item.quantity}")
-                logger.info(f"      Traffic Light: {item.stock_traffic_light}")
-                logger.info(f"      Type: {item.item_type}")
-                logger.info(f"      Timestamp: {item.timestamp}")
-                logger.info()
+                logger.info(
+                    "   %s. GTIN: %s, Quantity: %s, Traffic Light: %s, Type: %s, Timestamp: %s",
+                    i,
+                    item.gtin,
+                    item.quantity,
+                    item.stock_traffic_light,
+                    item.item_type,
+                    item.timestamp,
+                )
 
             if len(fetched_stock.stock_items) > 3:
-                logger.info(f"   ... and {len(fetched_stock.stock_items) - 3} more items")
+                logger.info("   ... and %s more items", len(fetched_stock.stock_items) - 3)
 
         # Display overall statistics
         total_gtins = len(gtin_stock_app_service.get_all_gtin_codes())
@@ -245,8 +210,8 @@ def run_legacy_sync_process() -> None:
         f"\n--- Starting Legacy GTIN Stock Synchronization at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---"
     )
 
-    create_gtin_stock_db_tables()
-    gtin_stock_app_service, _ = setup_gtin_stock_dependencies()
+    gtin_stock_app_service, gtin_stock_repository = setup_gtin_stock_dependencies()
+    create_gtin_stock_db_tables(gtin_stock_repository)
 
     try:
         gtin_stock_app_service.sync_all_supplier_stock(SUPPLIERS_CONFIG_PATH)
@@ -266,12 +231,14 @@ def run_legacy_sync_process() -> None:
 
             logger.info(f"Sample GLN: {supplier_glns[0]}, Items: {len(fetched_stock.stock_items)}")
             for item in fetched_stock.stock_items[:3]:
-                logger.info(f"  GTIN: {item.gtin}, Qty: {item.quantity}, Light: {item.stock_traffic_light}")
+                logger.info("  GTIN: %s, Qty: %s, Light: %s", item.gtin, item.quantity, item.stock_traffic_light)
 
     except (APIError, DatabaseError, ApplicationError) as e:
         logger.error(f"An error occurred during GTIN Stock synchronization: {e}")
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
+    finally:
+        gtin_stock_app_service.api_client.close()
 
     logger.info(f"--- GTIN Stock Synchronization Finished at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
 
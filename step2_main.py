@@ -25,7 +25,7 @@ from src.product_availability_domain.infrastructure.persistence.mysql_gtin_stock
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = getattr(settings, "ARTICLE_BATCH_SIZE", 100)
+BATCH_SIZE = settings.ARTICLE_BATCH_SIZE
 
 
 def setup_dependencies() -> tuple[ArticleApplicationService, GtinStockApplicationService]:
@@ -47,28 +47,23 @@ def setup_dependencies() -> tuple[ArticleApplicationService, GtinStockApplicatio
     return article_app_service, gtin_stock_service
 
 
-def create_article_tables() -> None:
+def create_article_tables(article_repo: MySQLArticleRepository) -> None:
     """Creates tables for article domain."""
-    article_repo = MySQLArticleRepository()
     try:
         article_repo.create_tables()
     except DatabaseError as e:
         logger.error(f"Error creating article database tables: {e}")
         raise
-    finally:
-        del article_repo
 
 
 def run_gtin_article_sync() -> None:
     """Main process: get supplier GLN and GTIN pairs, fetch article data, save to MySQL in batches."""
-    create_article_tables()
     article_app_service, gtin_stock_service = setup_dependencies()
+    create_article_tables(article_app_service.article_repo)
 
     try:
         logger.info("\n--- Fetching supplier GLN and GTIN pairs from stock table ---")
-        # Get pairs directly from repository since service might not have this method
-        gtin_stock_repository = MySQLGtinStockRepository()
-        supplier_gtin_pairs = gtin_stock_repository.get_all_supplier_gtin_pairs()
+        supplier_gtin_pairs = gtin_stock_service.get_all_supplier_gtin_pairs()
 
         if not supplier_gtin_pairs:
             logger.warning("No supplier GLN and GTIN pairs found in pds_gtin_stock table. Exiting.")
@@ -81,7 +76,14 @@ def run_gtin_article_sync() -> None:
         logger.info("\n--- Synchronizing article data using supplier GLN and GTIN pairs (batch processing) ---")
 
         # supplier_gtin_pairs = supplier_gtin_pairs[:10]
-        article_app_service.sync_articles_from_ecc(supplier_gtin_pairs)
+        if settings.ARTICLE_DEFER_INDEXES:
+            article_app_service.article_repo.drop_secondary_indexes()
+            try:
+                article_app_service.sync_articles_from_ecc(supplier_gtin_pairs)
+            finally:
+                article_app_service.article_repo.rebuild_secondary_indexes()
+        else:
+            article_app_service.sync_articles_from_ecc(supplier_gtin_pairs)
 
         logger.info("Completed processing all supplier GLN and GTIN pairs")
 
@@ -91,10 +93,12 @@ def run_gtin_article_sync() -> None:
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
         raise
+    finally:
+        article_app_service.ecc_api_client.close()
 
 
 if __name__ == "__main__":
     setup_logging(log_file="logs/my_app.log")
-    logger.info("Starting GTIN article data synchronization with batch processing (batch size: {BATCH_SIZE})...")
+    logger.info(f"Starting GTIN article data synchronization with batch processing (batch size: {BATCH_SIZE})...")
     run_gtin_article_sync()
     logger.info("GTIN article synchronization completed.")
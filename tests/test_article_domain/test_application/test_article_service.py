@@ -8,6 +8,7 @@ from src.article_domain.application.article_service import ArticleApplicationSer
 from src.article_domain.domain.repositories.article_repository import IArticleRepository
 from src.article_domain.infrastructure.api_clients.ecc_api_client import ECCApiClient
 from src.common.dtos.article_dtos import ArticleDataDTO
+from src.common.exceptions.custom_exceptions import DatabaseError
 
 
 class TestArticleApplicationService:
@@ -23,6 +24,7 @@ class TestArticleApplicationService:
         supplier_gtin_pairs = [("5790000017089", "1234567890123"), ("5790000017089", "1234567890124")]
         mock_articles = [ArticleDataDTO(eccId=1, ean="1234567890123"), ArticleDataDTO(eccId=2, ean="1234567890124")]
         self.mock_api_client.fetch_articles_by_gtin.return_value = mock_articles
+        self.mock_repo.save_articles_bulk.return_value = len(mock_articles)
 
         # Act
         self.service.sync_articles_from_ecc(supplier_gtin_pairs)
@@ -30,9 +32,69 @@ class TestArticleApplicationService:
         # Assert
         # The API client method now also expects supplier_gtin_pairs
         self.mock_api_client.fetch_articles_by_gtin.assert_called_once_with(supplier_gtin_pairs)
+        self.mock_repo.save_articles_bulk.assert_called_once_with(mock_articles)
+        self.mock_repo.save_article.assert_not_called()
+
+    def test_sync_articles_from_ecc_falls_back_to_single_saves(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a failed bulk save retries the batch article by article."""
+        # Arrange
+        supplier_gtin_pairs = [("5790000017089", "1234567890123"), ("5790000017089", "1234567890124")]
+        mock_articles = [ArticleDataDTO(eccId=1, ean="1234567890123"), ArticleDataDTO(eccId=2, ean="1234567890124")]
+        self.mock_api_client.fetch_articles_by_gtin.return_value = mock_articles
+        self.mock_repo.save_articles_bulk.side_effect = DatabaseError("Data too long")
+
+        def save_article(article_dto: ArticleDataDTO) -> None:
+            if article_dto.ean == "1234567890124":
+                raise DatabaseError("Data too long")
+
+        self.mock_repo.save_article.side_effect = save_article
+
+        # Act
+        self.service.sync_articles_from_ecc(supplier_gtin_pairs)
+
+        # Assert
+        self.mock_repo.save_articles_bulk.assert_called_once_with(mock_articles)
         assert self.mock_repo.save_article.call_count == 2
         self.mock_repo.save_article.assert_any_call(mock_articles[0])
         self.mock_repo.save_article.assert_any_call(mock_articles[1])
+        # Failures are reported once per batch instead of once per article
+        failure_logs = [message for message in caplog.messages if "failed article saves" in message]
+        assert failure_logs == [
+            "Batch 1 had 1 failed article saves (first 10 EAN/error): [('1234567890124', 'Database Error: Data too long')]"
+        ]
+
+    def test_sync_articles_from_ecc_pipelines_batches_in_order(self) -> None:
+        """Test that prefetched batches are saved in order and a failed fetch only skips its batch."""
+        # Arrange
+        self.service.batch_size = 1
+        supplier_gtin_pairs = [("5790000017089", "1"), ("5790000017089", "2"), ("5790000017089", "3")]
+        first_batch = [ArticleDataDTO(eccId=1, ean="1")]
+        third_batch = [ArticleDataDTO(eccId=3, ean="3")]
+        self.mock_api_client.fetch_articles_by_gtin.side_effect = [first_batch, Exception("timeout"), third_batch]
+        self.mock_repo.save_articles_bulk.return_value = 1
+
+        # Act
+        self.service.sync_articles_from_ecc(supplier_gtin_pairs)
+
+        # Assert
+        assert self.mock_api_client.fetch_articles_by_gtin.call_count == 3
+        assert self.mock_repo.save_articles_bulk.call_args_list == [((first_batch,),), ((third_batch,),)]
+
+    def test_sync_articles_from_ecc_reports_rows_actually_saved(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the batch summary uses the count returned by the bulk save, not the number received."""
+        # Arrange
+        supplier_gtin_pairs = [("5790000017089", "1234567890123"), ("5790000017089", "1234567890124")]
+        mock_articles = [ArticleDataDTO(eccId=1, ean="1234567890123", suGln="5790000017089"), ArticleDataDTO(eccId=2)]
+        self.mock_api_client.fetch_articles_by_gtin.return_value = mock_articles
+        self.mock_repo.save_articles_bulk.return_value = 1
+
+        # Act
+        with caplog.at_level("INFO"):
+            self.service.sync_articles_from_ecc(supplier_gtin_pairs)
+
+        # Assert
+        assert "Batch 1 completed: 1 articles saved from 2 received" in caplog.messages
+        assert "  - Total saved articles: 1" in caplog.messages
 
     def test_sync_articles_from_ecc_no_data(self) -> None:
         """Test synchronization when API returns no data."""
@@ -45,6 +107,7 @@ class TestArticleApplicationService:
 
         # Assert
         self.mock_api_client.fetch_articles_by_gtin.assert_called_once_with(supplier_gtin_pairs)
+        self.mock_repo.save_articles_bulk.assert_not_called()
         self.mock_repo.save_article.assert_not_called()
 
     def test_sync_articles_from_ecc_empty_gtin_list(self) -> None:
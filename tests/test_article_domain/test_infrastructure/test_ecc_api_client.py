@@ -17,9 +17,10 @@ class TestECCApiClient:
         with patch("src.article_domain.infrastructure.api_clients.ecc_api_client.settings") as mock_settings:
             mock_settings.ECC_API_BASE_URL = "https://api.example.com"
             mock_settings.ECC_API_TOKEN = "test_token"
+            mock_settings.ECC_API_MAX_WORKERS = 4
             self.client = ECCApiClient()
 
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
     def test_fetch_articles_by_gtin_success(self, mock_get: Mock) -> None:
         """Test successful article fetching by GTIN."""
         # Arrange
@@ -57,11 +58,10 @@ class TestECCApiClient:
         assert result[0].ean == "0194891750349"
 
         expected_url = f"https://api.example.com/articleData/byEanAndSuGln/{ean}/{su_gln}/de"
-        mock_get.assert_called_once_with(expected_url, params={"token": "test_token"}, timeout=30)
+        mock_get.assert_called_once_with(expected_url, timeout=30)
 
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
-    @patch("builtins.print")  # Added patch for print to prevent console output during test
-    def test_fetch_articles_by_gtin_multiple_gtins(self, mock_print: Mock, mock_get: Mock) -> None:
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_multiple_gtins(self, mock_get: Mock, caplog: pytest.LogCaptureFixture) -> None:
         """Test fetching articles for multiple GTINs."""
         # Arrange
         supplier_gtin_pairs = [("5790000017089", "0194891750349"), ("5790000017089", "0194891750356")]
@@ -91,26 +91,32 @@ class TestECCApiClient:
                 }
             ]
         }
-        mock_get.side_effect = [mock_response_1, mock_response_2]
+        responses_by_url = {
+            "https://api.example.com/articleData/byEanAndSuGln/0194891750349/5790000017089/de": mock_response_1,
+            "https://api.example.com/articleData/byEanAndSuGln/0194891750356/5790000017089/de": mock_response_2,
+        }
+        mock_get.side_effect = lambda url, **_kwargs: responses_by_url[url]
 
         # Act
-        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+        with caplog.at_level("INFO"):
+            result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
 
         # Assert
         assert len(result) == 2
+        # Results keep the order of the input pairs even though requests run concurrently
+        assert [dto.eccId for dto in result] == [6651663, 6651664]
         assert mock_get.call_count == 2
 
         expected_url_1 = "https://api.example.com/articleData/byEanAndSuGln/0194891750349/5790000017089/de"
         expected_url_2 = "https://api.example.com/articleData/byEanAndSuGln/0194891750356/5790000017089/de"
-        mock_get.assert_any_call(expected_url_1, params={"token": "test_token"}, timeout=30)
-        mock_get.assert_any_call(expected_url_2, params={"token": "test_token"}, timeout=30)
-        # Verify print calls for each API request
-        mock_print.assert_any_call("Get data for 0194891750349 5790000017089")
-        mock_print.assert_any_call("Get data for 0194891750356 5790000017089")
-
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
-    @patch("builtins.print")  # Added patch for print
-    def test_fetch_articles_by_gtin_no_articles(self, mock_print: Mock, mock_get: Mock) -> None:
+        mock_get.assert_any_call(expected_url_1, timeout=30)
+        mock_get.assert_any_call(expected_url_2, timeout=30)
+        # Verify log messages for each API request
+        assert "Get data for 0194891750349 5790000017089" in caplog.messages
+        assert "Get data for 0194891750356 5790000017089" in caplog.messages
+
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_no_articles(self, mock_get: Mock, caplog: pytest.LogCaptureFixture) -> None:
         """Test fetching when API returns no articles."""
         # Arrange
         supplier_gtin_pairs = [("5790000017089", "0194891750349")]
@@ -123,19 +129,22 @@ class TestECCApiClient:
         mock_get.return_value = mock_response
 
         # Act
-        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+        with caplog.at_level("INFO"):
+            result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
 
         # Assert
         assert len(result) == 0
         expected_url = f"https://api.example.com/articleData/byEanAndSuGln/{ean}/{su_gln}/de"
-        mock_get.assert_called_once_with(expected_url, params={"token": "test_token"}, timeout=30)
-        mock_print.assert_any_call(f"Get data for {ean} {su_gln}")
-        mock_print.assert_any_call(f"No articles found for EAN: {ean}, Supplier GLN: {su_gln}")
-        assert mock_print.call_count == 2  # Expect two print calls
-
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
-    @patch("builtins.print")
-    def test_fetch_articles_by_gtin_request_exception(self, mock_print: Mock, mock_get: Mock) -> None:
+        mock_get.assert_called_once_with(expected_url, timeout=30)
+        assert caplog.messages == [
+            f"Get data for {ean} {su_gln}",
+            f"No articles found for EAN: {ean}, Supplier GLN: {su_gln}",
+        ]
+
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_request_exception(
+        self, mock_get: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Test handling of request exceptions."""
         # Arrange
         supplier_gtin_pairs = [("5790000017089", "0194891750349")]
@@ -145,21 +154,22 @@ class TestECCApiClient:
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
 
         # Act
-        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+        with caplog.at_level("INFO"):
+            result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
 
         # Assert
         assert len(result) == 0
-        mock_print.assert_any_call(f"Get data for {test_gtin} {test_su_gln}")  # Initial print
-        mock_print.assert_any_call(
-            f"API request failed for EAN {test_gtin}, Supplier GLN {test_su_gln}: Connection error"
-        )  # Error print
-        assert mock_print.call_count == 2  # Expect two print calls
+        assert caplog.messages == [
+            f"Get data for {test_gtin} {test_su_gln}",
+            f"API request failed for EAN {test_gtin}, Supplier GLN {test_su_gln}: Connection error",
+        ]
         expected_url = f"https://api.example.com/articleData/byEanAndSuGln/{test_gtin}/{test_su_gln}/de"
-        mock_get.assert_called_once_with(expected_url, params={"token": "test_token"}, timeout=30)
+        mock_get.assert_called_once_with(expected_url, timeout=30)
 
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
-    @patch("builtins.print")
-    def test_fetch_articles_by_gtin_json_decode_error(self, mock_print: Mock, mock_get: Mock) -> None:
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_json_decode_error(
+        self, mock_get: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Test handling of JSON decode errors."""
         # Arrange
         test_gtin = "0194891750349"
@@ -179,22 +189,30 @@ class TestECCApiClient:
         mock_get.return_value = mock_response
 
         # Act
-        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+        with caplog.at_level("INFO"):
+            result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
 
         # Assert
         assert len(result) == 0
-        # Now assert for both expected print calls
-        mock_print.assert_any_call(f"Get data for {test_gtin} {test_su_gln}")
 
         # The str() of JSONDecodeError includes doc and pos automatically
         expected_error_message = (
             f"Failed to decode JSON response for EAN {test_gtin}, Supplier GLN {test_su_gln}: {mock_json_decode_error}"
         )
-        mock_print.assert_any_call(expected_error_message)
-
-        assert mock_print.call_count == 2  # Expected two print calls
+        assert caplog.messages == [f"Get data for {test_gtin} {test_su_gln}", expected_error_message]
         expected_url = f"https://api.example.com/articleData/byEanAndSuGln/{test_gtin}/{test_su_gln}/de"
-        mock_get.assert_called_once_with(expected_url, params={"token": "test_token"}, timeout=30)
+        mock_get.assert_called_once_with(expected_url, timeout=30)
+
+    def test_session_sends_token_with_every_request(self) -> None:
+        """Test that the token is attached to the session once instead of per request."""
+        assert self.client.session.params == {"token": "test_token"}
+
+    def test_close_closes_session(self) -> None:
+        """Test that closing the client (or leaving its context) closes the HTTP session."""
+        with patch.object(self.client.session, "close") as mock_close, self.client:
+            pass
+
+        mock_close.assert_called_once()
 
     def test_fetch_articles_by_gtin_no_token(self) -> None:
         """Test error when API token is not set."""
@@ -202,13 +220,14 @@ class TestECCApiClient:
         with patch("src.article_domain.infrastructure.api_clients.ecc_api_client.settings") as mock_settings:
             mock_settings.ECC_API_BASE_URL = "https://api.example.com"
             mock_settings.ECC_API_TOKEN = None
+            mock_settings.ECC_API_MAX_WORKERS = 4
             client = ECCApiClient()
 
         # Act & Assert
         with pytest.raises(APIError, match="ECC_API_TOKEN is not set"):
             client.fetch_articles_by_gtin([("5790000017089", "0194891750349")])
 
-    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.get")
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
     def test_fetch_articles_by_gtin_empty_list(self, mock_get: Mock) -> None:
         """Test fetching with empty GTIN list."""
         # Arrange
@@ -220,3 +239,44 @@ class TestECCApiClient:
         # Assert
         assert len(result) == 0
         mock_get.assert_not_called()
+
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_invalid_article_does_not_abort(self, mock_get: Mock) -> None:
+        """Test that an article without suGln is skipped while other pairs are still returned."""
+        # Arrange
+        supplier_gtin_pairs = [("5790000017089", "0194891750349"), ("5790000017089", "0194891750356")]
+
+        valid_response = Mock()
+        valid_response.json.return_value = {"articles": [{"eccId": 6651663, "suGln": "5790000017089"}]}
+        invalid_response = Mock()
+        invalid_response.json.return_value = {"articles": [{"eccId": 6651664}]}
+
+        responses_by_url = {
+            "https://api.example.com/articleData/byEanAndSuGln/0194891750349/5790000017089/de": valid_response,
+            "https://api.example.com/articleData/byEanAndSuGln/0194891750356/5790000017089/de": invalid_response,
+        }
+        mock_get.side_effect = lambda url, **_kwargs: responses_by_url[url]
+
+        # Act
+        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+
+        # Assert
+        assert [dto.eccId for dto in result] == [6651663]
+        assert mock_get.call_count == 2
+
+    @patch("src.article_domain.infrastructure.api_clients.ecc_api_client.requests.Session.get")
+    def test_fetch_articles_by_gtin_skips_duplicate_pairs(self, mock_get: Mock) -> None:
+        """Test that a repeated supplier GLN and GTIN pair triggers only one API request."""
+        # Arrange
+        supplier_gtin_pairs = [("5790000017089", "0194891750349")] * 3
+
+        mock_response = Mock()
+        mock_response.json.return_value = {"articles": [{"eccId": 6651663, "suGln": "5790000017089"}]}
+        mock_get.return_value = mock_response
+
+        # Act
+        result = self.client.fetch_articles_by_gtin(supplier_gtin_pairs)
+
+        # Assert
+        assert len(result) == 1
+        mock_get.assert_called_once()
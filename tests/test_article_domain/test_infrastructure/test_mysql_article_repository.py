@@ -0,0 +1,424 @@
+# tests/test_article_domain/test_infrastructure/test_mysql_article_repository.py
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import mysql.connector.pooling
+import pytest
+from mysql.connector import Error
+from mysql.connector.cursor import RE_SQL_INSERT_STMT
+from mysql.connector.errors import PoolError
+
+from src.article_domain.infrastructure.persistence.mysql_article_repository import (
+    ARTICLE_COLUMNS,
+    ARTICLE_SECONDARY_INDEXES,
+    MySQLArticleRepository,
+)
+from src.common.config.settings import settings
+from src.common.dtos.article_dtos import ArticleDataDTO
+from src.common.exceptions.custom_exceptions import DatabaseError
+from src.common.utils import db_utils
+from src.common.utils.db_utils import pooled_connection
+
+
+@pytest.fixture
+def mock_pooled_connection(mocker) -> Mock:
+    """Patches the shared connection pool and returns the connection it hands out."""
+    mock_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = Mock()
+    mock_pool.return_value.get_connection.return_value = mock_connection
+    return mock_connection
+
+
+@pytest.fixture
+def sample_article_dtos() -> list[ArticleDataDTO]:
+    """Sample list of ArticleDataDTOs ready to be persisted."""
+    return [
+        ArticleDataDTO(
+            eccId=6651663,
+            ean="0194891750349",
+            suGln="5790000017089",
+            brandOriginal="Ecco",
+            dateChanged="2025-01-15T10:30:00Z",
+            images=["https://example.com/image.jpg"],
+        ),
+        ArticleDataDTO(eccId=6651664, ean="0194891750356", suGln="5790000017089"),
+    ]
+
+
+def test_save_articles_bulk_uses_single_executemany(mock_pooled_connection, sample_article_dtos) -> None:
+    """
+    Tests that save_articles_bulk sends all rows through one executemany and commits once.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLArticleRepository()
+    saved_count = repo.save_articles_bulk(sample_article_dtos)
+
+    assert saved_count == len(sample_article_dtos)
+    mock_cursor.executemany.assert_called_once()
+    query, params_list = mock_cursor.executemany.call_args[0]
+    assert query.startswith("INSERT INTO pds_articles")
+    assert "ON DUPLICATE KEY UPDATE" in query
+    assert len(params_list) == 2
+    assert all(len(row) == len(ARTICLE_COLUMNS) for row in params_list)
+
+    first_row = dict(zip(ARTICLE_COLUMNS, params_list[0]))
+    assert first_row["dateChanged"] == "2025-01-15 10:30:00"
+    assert json.loads(first_row["images"]) == ["https://example.com/image.jpg"]
+    assert json.loads(dict(zip(ARTICLE_COLUMNS, params_list[1]))["images"]) == []
+
+    mock_pooled_connection.commit.assert_called_once()
+    mock_cursor.close.assert_called_once()
+    # The connection is handed back to the pool
+    mock_pooled_connection.close.assert_called_once()
+
+
+def test_save_articles_bulk_chunks_large_batches(mock_pooled_connection, sample_article_dtos) -> None:
+    """
+    Tests that rows are sent in chunks of chunk_size but committed in a single transaction.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    article_dtos = sample_article_dtos + [ArticleDataDTO(eccId=6651665, ean="0194891750363", suGln="5790000017089")]
+
+    repo = MySQLArticleRepository()
+    repo.save_articles_bulk(article_dtos, chunk_size=2)
+
+    assert [len(call.args[1]) for call in mock_cursor.executemany.call_args_list] == [2, 1]
+    mock_pooled_connection.commit.assert_called_once()
+
+
+def test_save_articles_bulk_skips_articles_without_primary_key(mock_pooled_connection) -> None:
+    """
+    Tests that articles missing ean or suGln are dropped instead of failing the whole batch.
+    """
+    repo = MySQLArticleRepository()
+    saved_count = repo.save_articles_bulk([ArticleDataDTO(eccId=1, ean="0194891750349")])
+
+    assert saved_count == 0
+    mock_pooled_connection.cursor.assert_not_called()
+
+
+def test_save_articles_bulk_database_error(mock_pooled_connection, sample_article_dtos) -> None:
+    """
+    Tests that a failing executemany rolls back and raises DatabaseError.
+    """
+    mock_cursor = Mock()
+    mock_cursor.executemany.side_effect = Error("Data too long")
+    mock_pooled_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLArticleRepository()
+
+    with pytest.raises(DatabaseError, match="Error bulk saving 2 articles"):
+        repo.save_articles_bulk(sample_article_dtos)
+
+    mock_pooled_connection.rollback.assert_called_once()
+    mock_cursor.close.assert_called_once()
+    mock_pooled_connection.close.assert_called_once()
+
+
+def test_pool_error_is_wrapped_in_database_error(mocker) -> None:
+    """
+    Tests that an exhausted or unreachable pool surfaces as DatabaseError.
+    """
+    mocker.patch.object(settings, "DB_POOL_TIMEOUT_SECONDS", 0)
+    mock_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_pool.return_value.get_connection.side_effect = PoolError("Failed getting connection; pool exhausted")
+
+    repo = MySQLArticleRepository()
+
+    with pytest.raises(DatabaseError, match="Failed to get MySQL connection from pool"):
+        repo.delete_article(6651663)
+
+
+def test_connection_pool_builds_without_c_extension(mocker) -> None:
+    """
+    Tests that the pool is created with the pure-Python connector when the C extension is not installed.
+    """
+    mocker.patch.object(mysql.connector.pooling, "CMySQLConnection", None)
+    mocker.patch.object(mysql.connector.pooling.MySQLConnection, "connect")  # no server needed
+    mocker.patch.object(db_utils, "_pool", None)
+
+    pool = db_utils.get_connection_pool()
+
+    assert pool.pool_name == "pds"
+    assert pool.pool_size == settings.DB_POOL_SIZE
+
+
+def test_exhausted_pool_waits_for_held_connection(mocker) -> None:
+    """
+    Tests that a borrower waits for a connection held elsewhere instead of failing with PoolError.
+    """
+
+    class SingleConnectionPool:
+        """Mimics MySQLConnectionPool with pool_size=1: raises PoolError while its connection is out."""
+
+        def __init__(self) -> None:
+            self.lock = threading.Lock()
+            self.connection = Mock()
+            self.connection.close.side_effect = self.lock.release
+
+        def get_connection(self) -> Mock:
+            if not self.lock.acquire(blocking=False):
+                raise PoolError("Failed getting connection; pool exhausted")
+            return self.connection
+
+    pool = SingleConnectionPool()
+    mocker.patch("src.common.utils.db_utils.get_connection_pool", return_value=pool)
+    mocker.patch.object(settings, "DB_POOL_TIMEOUT_SECONDS", 5)
+    repo = MySQLArticleRepository()
+
+    with pooled_connection():
+        # The only connection is held while another thread tries to delete an article
+        worker = threading.Thread(target=repo.delete_article, args=(6651663,))
+        worker.start()
+        time.sleep(0.05)
+        assert worker.is_alive()
+
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    pool.connection.commit.assert_called_once()
+
+
+def test_iter_all_articles_streams_in_chunks(mock_pooled_connection) -> None:
+    """
+    Tests that iter_all_articles reads through an unbuffered cursor with fetchmany and decodes images.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_pooled_connection.unread_result = False
+    mock_cursor.fetchmany.side_effect = [
+        [{"eccId": 1, "ean": "0194891750349", "suGln": "5790000017089", "images": '["a.jpg"]'}],
+        [{"eccId": 2, "ean": "0194891750356", "suGln": "5790000017089", "images": None}],
+        [],
+    ]
+
+    repo = MySQLArticleRepository()
+    result = list(repo.iter_all_articles(fetch_size=1))
+
+    mock_pooled_connection.cursor.assert_called_once_with(dictionary=True, buffered=False)
+    mock_cursor.fetchmany.assert_called_with(1)
+    assert [dto.eccId for dto in result] == [1, 2]
+    assert result[0].images == ["a.jpg"]
+    assert result[1].images == []
+    mock_cursor.close.assert_called_once()
+    mock_pooled_connection.close.assert_called_once()
+
+
+def test_iter_all_articles_early_stop_drains_unread_rows(mock_pooled_connection) -> None:
+    """
+    Tests that closing the iterator early consumes pending rows before releasing the connection.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_pooled_connection.unread_result = True
+    mock_cursor.fetchmany.return_value = [{"eccId": 1, "ean": "0194891750349", "suGln": "5790000017089"}]
+
+    repo = MySQLArticleRepository()
+    iterator = repo.iter_all_articles()
+    next(iterator)
+    iterator.close()
+
+    mock_pooled_connection.consume_results.assert_called_once()
+    mock_cursor.close.assert_called_once()
+    mock_pooled_connection.close.assert_called_once()
+
+
+def test_save_article_uses_cached_upsert_sql(mock_pooled_connection, sample_article_dtos) -> None:
+    """
+    Tests that save_article sends the precomputed statement with one full row of parameters.
+    """
+    mock_cursor = Mock()
+    mock_cursor.rowcount = 1
+    mock_pooled_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLArticleRepository()
+    repo.save_article(sample_article_dtos[1])
+
+    query, params = mock_cursor.execute.call_args[0]
+    assert query is MySQLArticleRepository._UPSERT_SQL
+    assert len(params) == len(ARTICLE_COLUMNS)
+    assert "brandOriginal = COALESCE(VALUES(brandOriginal), brandOriginal)" in query
+    assert "ean = " not in query.split("ON DUPLICATE KEY UPDATE")[1]
+    mock_pooled_connection.commit.assert_called_once()
+
+
+def test_get_articles_by_ecc_ids_uses_single_in_query(mock_pooled_connection) -> None:
+    """
+    Tests that several ECC IDs are loaded in one IN query and returned grouped by eccId.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_cursor.fetchmany.side_effect = [
+        [
+            {"eccId": 1, "ean": "0194891750349", "suGln": "5790000017089"},
+            {"eccId": 2, "ean": "0194891750356", "suGln": "5790000017089"},
+        ],
+        [],
+    ]
+
+    repo = MySQLArticleRepository()
+    result = repo.get_articles_by_ecc_ids([1, 2, 2, 3])
+
+    mock_cursor.execute.assert_called_once_with("SELECT * FROM pds_articles WHERE eccId IN (%s,%s,%s)", (1, 2, 3))
+    assert set(result) == {1, 2}
+    assert [article.ean for article in result[2]] == ["0194891750356"]
+
+
+def test_get_articles_by_ecc_ids_keeps_rows_sharing_an_ecc_id(mock_pooled_connection) -> None:
+    """
+    Tests that rows with the same eccId (different ean/suGln) are all kept and the first one wins for a single lookup.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    rows = [
+        {"eccId": 1, "ean": "0194891750349", "suGln": "5790000017089"},
+        {"eccId": 1, "ean": "0194891750356", "suGln": "5790000017089"},
+    ]
+    mock_cursor.fetchmany.side_effect = [[dict(row) for row in rows], [], [dict(row) for row in rows], []]
+
+    repo = MySQLArticleRepository()
+
+    assert [article.ean for article in repo.get_articles_by_ecc_ids([1])[1]] == ["0194891750349", "0194891750356"]
+    assert repo.get_article_by_ecc_id(1).ean == "0194891750349"
+
+
+def test_get_articles_by_ecc_ids_error_drains_unread_rows(mock_pooled_connection) -> None:
+    """
+    Tests that a failure mid-read consumes pending rows before the connection goes back to the pool.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_pooled_connection.unread_result = True
+    mock_cursor.fetchmany.side_effect = Error("Lost connection during fetch")
+
+    repo = MySQLArticleRepository()
+
+    with pytest.raises(DatabaseError, match="Error fetching 1 articles by eccId"):
+        repo.get_articles_by_ecc_ids([1])
+
+    mock_pooled_connection.consume_results.assert_called_once()
+    mock_cursor.close.assert_called_once()
+    mock_pooled_connection.close.assert_called_once()
+
+
+def test_get_article_by_ecc_id_not_found(mock_pooled_connection) -> None:
+    """
+    Tests that a missing article yields None.
+    """
+    mock_cursor = Mock()
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_cursor.fetchmany.return_value = []
+
+    repo = MySQLArticleRepository()
+
+    assert repo.get_article_by_ecc_id(404) is None
+
+
+def test_get_articles_by_ecc_ids_empty_list(mock_pooled_connection) -> None:
+    """
+    Tests that an empty ID list does not touch the database.
+    """
+    repo = MySQLArticleRepository()
+
+    assert repo.get_articles_by_ecc_ids([]) == {}
+    mock_pooled_connection.cursor.assert_not_called()
+
+
+def test_search_articles_builds_sorted_where_clause(mock_pooled_connection) -> None:
+    """
+    Tests that filters become a stable, parameterized WHERE clause and None filters are ignored.
+    """
+    mock_cursor = Mock()
+    mock_cursor.fetchmany.side_effect = [[{"eccId": 1, "ean": "0194891750349", "suGln": "5790000017089"}], []]
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_pooled_connection.unread_result = False
+
+    repo = MySQLArticleRepository()
+    result = repo.search_articles(suGln="5790000017089", brandOriginal="Ecco", colorName=None)
+
+    mock_cursor.execute.assert_called_once_with(
+        "SELECT * FROM pds_articles WHERE brandOriginal = %s AND suGln = %s", ["Ecco", "5790000017089"]
+    )
+    assert [dto.eccId for dto in result] == [1]
+    mock_pooled_connection.cursor.assert_called_once_with(dictionary=True, buffered=False)
+
+
+def test_search_articles_rejects_unknown_columns(mock_pooled_connection) -> None:
+    """
+    Tests that filter names outside the pds_articles columns never reach the SQL string.
+    """
+    repo = MySQLArticleRepository()
+
+    with pytest.raises(ValueError, match="unknown columns"):
+        repo.search_articles(**{"1=1 OR ean": "x"})
+
+    mock_pooled_connection.cursor.assert_not_called()
+
+
+def test_upsert_sql_is_eligible_for_executemany_batching() -> None:
+    """
+    Tests that the cached upsert matches the pattern mysql-connector uses to rewrite executemany
+    into one multi-row INSERT; a statement that stops matching silently degrades to one round-trip per row.
+    """
+    assert RE_SQL_INSERT_STMT.match(MySQLArticleRepository._UPSERT_SQL)
+
+
+def test_search_articles_merges_multi_value_filters_into_in(mock_pooled_connection) -> None:
+    """
+    Tests that list-valued filters become one IN condition instead of separate queries.
+    """
+    mock_cursor = Mock()
+    mock_cursor.fetchmany.side_effect = [[], []]
+    mock_pooled_connection.cursor.return_value = mock_cursor
+    mock_pooled_connection.unread_result = False
+
+    repo = MySQLArticleRepository()
+    repo.search_articles(ean=["0194891750349", "0194891750356"], suGln="5790000017089")
+
+    mock_cursor.execute.assert_called_once_with(
+        "SELECT * FROM pds_articles WHERE ean IN (%s,%s) AND suGln = %s",
+        ["0194891750349", "0194891750356", "5790000017089"],
+    )
+
+
+def test_search_articles_empty_in_filter_skips_query(mock_pooled_connection) -> None:
+    """
+    Tests that an empty list filter returns no articles without querying the database.
+    """
+    repo = MySQLArticleRepository()
+
+    assert repo.search_articles(ean=[]) == []
+    mock_pooled_connection.cursor.assert_not_called()
+
+
+def test_drop_secondary_indexes_drops_only_existing_ones(mock_pooled_connection) -> None:
+    """
+    Tests that secondary indexes are dropped in one ALTER TABLE and absent ones are skipped.
+    """
+    mock_cursor = Mock()
+    mock_cursor.fetchall.return_value = [("PRIMARY",), ("eccId",), ("brandOriginal",)]
+    mock_pooled_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLArticleRepository()
+    repo.drop_secondary_indexes()
+
+    mock_cursor.execute.assert_called_with("ALTER TABLE pds_articles DROP INDEX eccId, DROP INDEX brandOriginal")
+
+
+def test_rebuild_secondary_indexes_adds_missing_ones(mock_pooled_connection) -> None:
+    """
+    Tests that only missing secondary indexes are recreated, all in one ALTER TABLE.
+    """
+    mock_cursor = Mock()
+    mock_cursor.fetchall.return_value = [("PRIMARY",)] + [(col,) for col in ARTICLE_SECONDARY_INDEXES[1:]]
+    mock_pooled_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLArticleRepository()
+    repo.rebuild_secondary_indexes()
+
+    mock_cursor.execute.assert_called_with("ALTER TABLE pds_articles ADD INDEX eccId (eccId)")
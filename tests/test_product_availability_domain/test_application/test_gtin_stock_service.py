@@ -2,8 +2,9 @@
 """Tests for the GTIN Stock Application Service."""
 
 import json
+import os
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 import pytz
@@ -18,13 +19,37 @@ from src.common.dtos.availability_dtos import (
     GtinStockResponseDTO,
     SupplierContextDTO,
 )
-from src.common.exceptions.custom_exceptions import APIError, DatabaseError
+from src.common.exceptions.custom_exceptions import APIError, ApplicationError, DatabaseError
+from src.product_availability_domain.application.gtin_stock_service import load_suppliers_list
 
 # All fixtures (mock_gtin_stock_repository, mock_global_stock_api_client, gtin_stock_service,
 # sample_supplier_context_dto, sample_suppliers_json_data, sample_gtin_stock_item_dto_list,
 # sample_gtin_stock_item_dto_list_ecco) are automatically available from conftest.py
 
 
+def write_suppliers_config(tmp_path, content: str) -> str:
+    """Writes a suppliers configuration file and returns its path."""
+    config_file = tmp_path / "suppliers.json"
+    config_file.write_text(content)
+    return str(config_file)
+
+
+def in_supplier_order(suppliers_json_data: list[dict], results: list) -> callable:
+    """
+    Builds a mock side_effect that returns results[i] for the i-th configured supplier (raising
+    exceptions as-is), so assertions do not depend on the order concurrently synced suppliers call it.
+    """
+    results_by_gln = {supplier["SUPPLIER_GLN"]: result for supplier, result in zip(suppliers_json_data, results)}
+
+    def side_effect(supplier_context: SupplierContextDTO, *_args, **_kwargs):
+        result = results_by_gln[supplier_context.supplier_gln]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return side_effect
+
+
 def test_sync_all_supplier_stock_success(
     gtin_stock_service,
     mock_global_stock_api_client,
@@ -32,39 +57,41 @@ def test_sync_all_supplier_stock_success(
     sample_suppliers_json_data,
     sample_gtin_stock_item_dto_list,
     sample_gtin_stock_item_dto_list_ecco,
-    mocker,
+    tmp_path,
 ) -> None:
     """
     Tests successful synchronization of GTIN stock data for multiple suppliers.
     Verifies API client calls and repository batch save operations.
     """
-    mocker.patch("builtins.open", mocker.mock_open(read_data=json.dumps(sample_suppliers_json_data)))
-    mocker.patch("json.load", return_value=sample_suppliers_json_data)
-
-    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = [
-        GtinStockResponseDTO(
-            supplier_context=SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=87,
-                supplier_gln="4042834000005",
-                supplier_name="Josef Seibel",
+    config_path = write_suppliers_config(tmp_path, json.dumps(sample_suppliers_json_data))
+
+    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = in_supplier_order(
+        sample_suppliers_json_data,
+        [
+            GtinStockResponseDTO(
+                supplier_context=SupplierContextDTO(
+                    retailer_id=settings.RETAILER_ID,
+                    retailer_gln=settings.RETAILER_GLN,
+                    supplier_id=87,
+                    supplier_gln="4042834000005",
+                    supplier_name="Josef Seibel",
+                ),
+                stock_items=sample_gtin_stock_item_dto_list,
             ),
-            stock_items=sample_gtin_stock_item_dto_list,
-        ),
-        GtinStockResponseDTO(
-            supplier_context=SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=564,
-                supplier_gln="5790000017089",
-                supplier_name="Ecco Schuhe GmbH",
+            GtinStockResponseDTO(
+                supplier_context=SupplierContextDTO(
+                    retailer_id=settings.RETAILER_ID,
+                    retailer_gln=settings.RETAILER_GLN,
+                    supplier_id=564,
+                    supplier_gln="5790000017089",
+                    supplier_name="Ecco Schuhe GmbH",
+                ),
+                stock_items=sample_gtin_stock_item_dto_list_ecco,
             ),
-            stock_items=sample_gtin_stock_item_dto_list_ecco,
-        ),
-    ]
+        ],
+    )
 
-    gtin_stock_service.sync_all_supplier_stock("dummy_path/suppliers.json")
+    gtin_stock_service.sync_all_supplier_stock(config_path)
 
     assert mock_global_stock_api_client.fetch_gtin_stock_data.call_count == len(sample_suppliers_json_data)
 
@@ -98,14 +125,13 @@ def test_sync_all_supplier_stock_success(
 
 
 def test_sync_all_supplier_stock_no_data_from_api(
-    gtin_stock_service, mock_global_stock_api_client, mock_gtin_stock_repository, sample_suppliers_json_data, mocker
+    gtin_stock_service, mock_global_stock_api_client, mock_gtin_stock_repository, sample_suppliers_json_data, tmp_path
 ) -> None:
     """
     Tests synchronization when the API returns no data for a supplier.
     Verifies that no save operations are performed on the repository for that supplier.
     """
-    mocker.patch("builtins.open", mocker.mock_open(read_data=json.dumps(sample_suppliers_json_data)))
-    mocker.patch("json.load", return_value=sample_suppliers_json_data)
+    config_path = write_suppliers_config(tmp_path, json.dumps(sample_suppliers_json_data))
 
     mock_api_response_dto_empty = GtinStockResponseDTO(
         supplier_context=SupplierContextDTO(
@@ -119,7 +145,7 @@ def test_sync_all_supplier_stock_no_data_from_api(
     )
     mock_global_stock_api_client.fetch_gtin_stock_data.return_value = mock_api_response_dto_empty
 
-    gtin_stock_service.sync_all_supplier_stock("dummy_path/suppliers.json")
+    gtin_stock_service.sync_all_supplier_stock(config_path)
 
     assert mock_global_stock_api_client.fetch_gtin_stock_data.called
     mock_gtin_stock_repository.save_gtin_stock_item.assert_not_called()
@@ -131,30 +157,32 @@ def test_sync_all_supplier_stock_api_error(
     mock_gtin_stock_repository,
     sample_suppliers_json_data,
     sample_gtin_stock_item_dto_list_ecco,
-    mocker,
+    tmp_path,
 ) -> None:
     """
     Tests synchronization when the API client raises an APIError for a supplier.
     Verifies that the error is caught and synchronization continues for other suppliers.
     """
-    mocker.patch("builtins.open", mocker.mock_open(read_data=json.dumps(sample_suppliers_json_data)))
-    mocker.patch("json.load", return_value=sample_suppliers_json_data)
-
-    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = [
-        APIError("API call failed for Josef Seibel"),
-        GtinStockResponseDTO(
-            supplier_context=SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=564,
-                supplier_gln="5790000017089",
-                supplier_name="Ecco Schuhe GmbH",
+    config_path = write_suppliers_config(tmp_path, json.dumps(sample_suppliers_json_data))
+
+    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = in_supplier_order(
+        sample_suppliers_json_data,
+        [
+            APIError("API call failed for Josef Seibel"),
+            GtinStockResponseDTO(
+                supplier_context=SupplierContextDTO(
+                    retailer_id=settings.RETAILER_ID,
+                    retailer_gln=settings.RETAILER_GLN,
+                    supplier_id=564,
+                    supplier_gln="5790000017089",
+                    supplier_name="Ecco Schuhe GmbH",
+                ),
+                stock_items=sample_gtin_stock_item_dto_list_ecco,
             ),
-            stock_items=sample_gtin_stock_item_dto_list_ecco,
-        ),
-    ]
+        ],
+    )
 
-    gtin_stock_service.sync_all_supplier_stock("dummy_path/suppliers.json")
+    gtin_stock_service.sync_all_supplier_stock(config_path)
 
     assert mock_global_stock_api_client.fetch_gtin_stock_data.call_count == len(sample_suppliers_json_data)
 
@@ -184,46 +212,51 @@ def test_sync_all_supplier_stock_database_error(
     sample_suppliers_json_data,
     sample_gtin_stock_item_dto_list,  # For JS
     sample_gtin_stock_item_dto_list_ecco,  # For Ecco
-    mocker,
+    tmp_path,
 ) -> None:
     """
     Tests synchronization when the repository raises a DatabaseError during batch save.
     Verifies that the error is caught and synchronization continues for other suppliers.
     """
-    mocker.patch("builtins.open", mocker.mock_open(read_data=json.dumps(sample_suppliers_json_data)))
-    mocker.patch("json.load", return_value=sample_suppliers_json_data)
-
-    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = [
-        GtinStockResponseDTO(
-            supplier_context=SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=87,
-                supplier_gln="4042834000005",
-                supplier_name="Josef Seibel",
+    config_path = write_suppliers_config(tmp_path, json.dumps(sample_suppliers_json_data))
+
+    mock_global_stock_api_client.fetch_gtin_stock_data.side_effect = in_supplier_order(
+        sample_suppliers_json_data,
+        [
+            GtinStockResponseDTO(
+                supplier_context=SupplierContextDTO(
+                    retailer_id=settings.RETAILER_ID,
+                    retailer_gln=settings.RETAILER_GLN,
+                    supplier_id=87,
+                    supplier_gln="4042834000005",
+                    supplier_name="Josef Seibel",
+                ),
+                stock_items=[sample_gtin_stock_item_dto_list[0]],  # Only one item from JS for this specific test case
             ),
-            stock_items=[sample_gtin_stock_item_dto_list[0]],  # Only one item from JS for this specific test case
-        ),
-        GtinStockResponseDTO(
-            supplier_context=SupplierContextDTO(
-                retailer_id=settings.RETAILER_ID,
-                retailer_gln=settings.RETAILER_GLN,
-                supplier_id=564,
-                supplier_gln="5790000017089",
-                supplier_name="Ecco Schuhe GmbH",
+            GtinStockResponseDTO(
+                supplier_context=SupplierContextDTO(
+                    retailer_id=settings.RETAILER_ID,
+                    retailer_gln=settings.RETAILER_GLN,
+                    supplier_id=564,
+                    supplier_gln="5790000017089",
+                    supplier_name="Ecco Schuhe GmbH",
+                ),
+                stock_items=sample_gtin_stock_item_dto_list_ecco,
             ),
-            stock_items=sample_gtin_stock_item_dto_list_ecco,
-        ),
-    ]
+        ],
+    )
 
     # Configure the mock repository to raise an exception on the first batch save (Josef Seibel)
     # and succeed on the second (Ecco).
-    mock_gtin_stock_repository.batch_save_gtin_stock_items.side_effect = [
-        DatabaseError("DB batch save failed for Josef Seibel items"),
-        None,  # Succeed for Ecco's batch
-    ]
+    mock_gtin_stock_repository.batch_save_gtin_stock_items.side_effect = in_supplier_order(
+        sample_suppliers_json_data,
+        [
+            DatabaseError("DB batch save failed for Josef Seibel items"),
+            None,  # Succeed for Ecco's batch
+        ],
+    )
 
-    gtin_stock_service.sync_all_supplier_stock("dummy_path/suppliers.json")
+    gtin_stock_service.sync_all_supplier_stock(config_path)
 
     # Verify that batch_save_gtin_stock_items was called for both suppliers,
     # despite the error on the first one.
@@ -257,6 +290,39 @@ def test_sync_all_supplier_stock_database_error(
     mock_gtin_stock_repository.save_gtin_stock_item.assert_not_called()
 
 
+def test_sync_all_supplier_stock_invalid_config(gtin_stock_service, mock_global_stock_api_client, tmp_path) -> None:
+    """
+    Tests that a malformed suppliers configuration raises ApplicationError before any API call.
+    """
+    config_path = write_suppliers_config(tmp_path, "{not json")
+
+    with pytest.raises(ApplicationError, match="Error decoding suppliers configuration"):
+        gtin_stock_service.sync_all_supplier_stock(config_path)
+
+    mock_global_stock_api_client.fetch_gtin_stock_data.assert_not_called()
+
+def test_load_suppliers_list_reloads_when_file_changes(tmp_path) -> None:
+    """
+    Tests that the suppliers configuration is parsed once per file version and re-read after it changes.
+    """
+    config_path = write_suppliers_config(tmp_path, json.dumps({"suppliers": [{"SUPPLIER_GLN": "1"}]}))
+
+    first = load_suppliers_list(config_path)
+    assert first == ({"SUPPLIER_GLN": "1"},)
+    assert load_suppliers_list(config_path) is first
+
+    write_suppliers_config(tmp_path, json.dumps([{"SUPPLIER_GLN": "2"}]))
+    os.utime(config_path, ns=(0, os.stat(config_path).st_mtime_ns + 1_000_000_000))
+
+    assert load_suppliers_list(config_path) == ({"SUPPLIER_GLN": "2"},)
+
+
+def test_load_suppliers_list_missing_file(tmp_path) -> None:
+    """Tests that a missing suppliers configuration raises ApplicationError."""
+    with pytest.raises(ApplicationError, match="Suppliers configuration file not found"):
+        load_suppliers_list(str(tmp_path / "missing.json"))
+
+
 def test_get_supplier_stock_data(gtin_stock_service, mock_gtin_stock_repository, sample_supplier_context_dto) -> None:
     """
     Tests retrieving GTIN stock data by supplier context.
@@ -346,3 +412,78 @@ def test_service_delegates_to_repository(gtin_stock_service, mock_gtin_stock_rep
     assert gln_result == test_glns
     mock_gtin_stock_repository.get_all_gtin_codes.assert_called_once()
     mock_gtin_stock_repository.get_unique_supplier_glns.assert_called_once()
+
+
+def test_sync_supplier_stock_with_callback_skips_fresh_gtins(
+    gtin_stock_service, mock_global_stock_api_client, mock_gtin_stock_repository, sample_supplier_context_dto, mocker
+) -> None:
+    """Tests that GTINs synced within STOCK_REFRESH_TTL_SECONDS are passed to the API client as skipped."""
+    mocker.patch.object(settings, "STOCK_REFRESH_TTL_SECONDS", 3600)
+    mock_gtin_stock_repository.get_recently_synced_gtins.return_value = {"1234567890001"}
+
+    gtin_stock_service.sync_supplier_stock_with_callback(sample_supplier_context_dto)
+
+    mock_gtin_stock_repository.get_recently_synced_gtins.assert_called_once_with(
+        sample_supplier_context_dto.supplier_gln, 3600
+    )
+    assert mock_global_stock_api_client.fetch_gtin_stock_data_optimized.call_args[1]["skip_gtins"] == {"1234567890001"}
+
+
+def test_sync_all_supplier_stock_skips_fresh_gtins(
+    gtin_stock_service,
+    mock_global_stock_api_client,
+    mock_gtin_stock_repository,
+    sample_suppliers_json_data,
+    tmp_path,
+    mocker,
+) -> None:
+    """Tests that the legacy all-supplier sync also skips GTINs synced within STOCK_REFRESH_TTL_SECONDS."""
+    mocker.patch.object(settings, "STOCK_REFRESH_TTL_SECONDS", 3600)
+    config_path = write_suppliers_config(tmp_path, json.dumps(sample_suppliers_json_data))
+    mock_gtin_stock_repository.get_recently_synced_gtins.side_effect = lambda gln, _ttl: {f"fresh-{gln}"}
+    mock_global_stock_api_client.fetch_gtin_stock_data.return_value = None
+
+    gtin_stock_service.sync_all_supplier_stock(config_path)
+
+    mock_gtin_stock_repository.get_recently_synced_gtins.assert_has_calls(
+        [call(supplier["SUPPLIER_GLN"], 3600) for supplier in sample_suppliers_json_data], any_order=True
+    )
+    skipped_by_gln = {
+        fetch_call.args[0].supplier_gln: fetch_call.kwargs["skip_gtins"]
+        for fetch_call in mock_global_stock_api_client.fetch_gtin_stock_data.call_args_list
+    }
+    assert skipped_by_gln == {
+        supplier["SUPPLIER_GLN"]: {f"fresh-{supplier['SUPPLIER_GLN']}"} for supplier in sample_suppliers_json_data
+    }
+
+
+def test_sync_supplier_stock_with_callback_ttl_disabled(
+    gtin_stock_service, mock_global_stock_api_client, mock_gtin_stock_repository, sample_supplier_context_dto, mocker
+) -> None:
+    """Tests that no freshness query is made when the refresh TTL is disabled."""
+    mocker.patch.object(settings, "STOCK_REFRESH_TTL_SECONDS", 0)
+
+    gtin_stock_service.sync_supplier_stock_with_callback(sample_supplier_context_dto)
+
+    mock_gtin_stock_repository.get_recently_synced_gtins.assert_not_called()
+    assert mock_global_stock_api_client.fetch_gtin_stock_data_optimized.call_args[1]["skip_gtins"] == set()
+
+
+def test_sync_supplier_stock_with_callback_saves_and_reports_progress(
+    gtin_stock_service,
+    mock_global_stock_api_client,
+    mock_gtin_stock_repository,
+    sample_supplier_context_dto,
+    sample_gtin_stock_item_dto_list,
+) -> None:
+    """Tests that the save callback handed to the API client saves the batch, then reports its size."""
+    progress_callback = Mock()
+
+    gtin_stock_service.sync_supplier_stock_with_callback(sample_supplier_context_dto, progress_callback=progress_callback)
+    save_callback = mock_global_stock_api_client.fetch_gtin_stock_data_optimized.call_args[1]["save_callback"]
+    save_callback(sample_supplier_context_dto, sample_gtin_stock_item_dto_list)
+
+    mock_gtin_stock_repository.batch_save_gtin_stock_items.assert_called_once_with(
+        sample_supplier_context_dto, sample_gtin_stock_item_dto_list
+    )
+    progress_callback.assert_called_once_with(sample_supplier_context_dto, len(sample_gtin_stock_item_dto_list))
@@ -4,6 +4,7 @@
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 import pytz
 import requests
@@ -25,7 +26,7 @@ def test_global_stock_api_client_get_gtins_with_stock_success(mocker) -> None:
     """Tests successful fetching of GTINs with stock."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = ["GTIN1", "GTIN2"]
+    mock_response.content = orjson.dumps(["GTIN1", "GTIN2"])
 
     mocker.patch.object(settings, "EAN_AVAILABILITY_API_TOKEN", "test_token")
 
@@ -45,7 +46,7 @@ def test_global_stock_api_client_get_gtin_availability_success(mocker) -> None:
     """Tests successful fetching of GTIN availability."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"stocksQueryResult": [{"gtin": "GTIN1", "quantity": 10}]}
+    mock_response.content = orjson.dumps({"stocksQueryResult": [{"gtin": "GTIN1", "quantity": 10}]})
 
     mocker.patch.object(settings, "EAN_AVAILABILITY_API_TOKEN", "test_token")
 
@@ -151,4 +152,116 @@ def test_global_stock_api_client_fetch_gtin_stock_data(mocker, sample_supplier_c
     assert len(result_dto.stock_items) == 2
 
     # Directly compare the stock_items, as they should be exactly what _process_gtin_batch returned
-    assert result_dto.stock_items == expected_stock_items
+    assert result_dto.stock_items == tuple(expected_stock_items)
+
+
+def test_global_stock_api_client_process_gtin_batch_keeps_gtin_order(mocker) -> None:
+    """Tests that a batch fetched concurrently returns items in GTIN order and skips GTINs without stock data."""
+    mocker.patch.object(settings, "STOCK_API_MAX_WORKERS", 3)
+    mocker.patch("time.sleep")
+
+    responses = {
+        "GTIN1": {
+            "stocksQueryResult": [
+                {"gtin": "GTIN1", "quantity": 10, "stockTrafficLight": "Green", "type": 1, "timestamp": "2023-01-01T10:00:00Z"}
+            ]
+        },
+        "GTIN2": {},
+        "GTIN3": {"stocksQueryResult": [{"gtin": "GTIN3", "quantity": 2, "stockTrafficLight": "Yellow", "type": 2}]},
+    }
+
+    client = GlobalStockApiClient()
+    mock_get_availability = mocker.patch.object(
+        client, "get_gtin_availability", side_effect=lambda gtin, _supplier_gln: responses[gtin]
+    )
+
+    result = client._process_gtin_batch(["GTIN1", "GTIN2", "GTIN3"], "supplier_gln_1", 1, 1)
+
+    assert mock_get_availability.call_count == 3
+    assert result == [
+        GtinStockItemDTO(
+            gtin="GTIN1",
+            quantity=10,
+            stock_traffic_light="Green",
+            item_type="Pair",
+            timestamp=datetime(2023, 1, 1, 10, 0, 0, tzinfo=pytz.utc),
+        ),
+        GtinStockItemDTO(gtin="GTIN3", quantity=2, stock_traffic_light="Yellow", item_type="Set", timestamp=None),
+    ]
+
+
+def test_global_stock_api_client_get_gtin_availability_uses_rate_limiter(mocker) -> None:
+    """Tests that every availability request takes a token from the shared rate limiter."""
+    mocker.patch.object(settings, "EAN_AVAILABILITY_API_TOKEN", "test_token")
+
+    client = GlobalStockApiClient()
+    mock_acquire = mocker.patch.object(client._rate_limiter, "acquire")
+    mocker.patch.object(client.session, "get", return_value=Mock(content=b"{}"))
+
+    client.get_gtin_availability("GTIN1", "supplier_gln_1")
+    client.get_gtin_availability("GTIN2", "supplier_gln_1")
+
+    assert mock_acquire.call_count == 2
+
+
+def test_global_stock_api_client_get_gtin_availability_invalid_json(mocker) -> None:
+    """Tests that an undecodable availability response is treated like a failed request."""
+    mocker.patch.object(settings, "EAN_AVAILABILITY_API_TOKEN", "test_token")
+
+    client = GlobalStockApiClient()
+    mocker.patch.object(client.session, "get", return_value=Mock(content=b"<html>Bad Gateway</html>"))
+
+    assert client.get_gtin_availability("GTIN1", "supplier_gln_1") == {}
+
+
+def test_global_stock_api_client_fetch_gtin_stock_data_optimized_skips_gtins(
+    mocker, sample_supplier_context_dto
+) -> None:
+    """Tests that GTINs in skip_gtins are not requested."""
+    client = GlobalStockApiClient()
+    mocker.patch.object(client, "get_gtins_with_stock", return_value=["GTIN1", "GTIN2", "GTIN3"])
+    mock_process_gtin_batch = mocker.patch.object(client, "_process_gtin_batch", return_value=[])
+
+    client.fetch_gtin_stock_data_optimized(sample_supplier_context_dto, max_workers=1, skip_gtins={"GTIN2"})
+
+    mock_process_gtin_batch.assert_called_once_with(["GTIN1", "GTIN3"], sample_supplier_context_dto.supplier_gln, 1, 1)
+
+
+def test_global_stock_api_client_fetch_gtin_stock_data_optimized_saves_every_batch(
+    mocker, sample_supplier_context_dto, caplog
+) -> None:
+    """Tests that batches are saved in order in the background and a failed save does not stop the sync."""
+    mocker.patch("time.sleep")
+    client = GlobalStockApiClient()
+    mocker.patch.object(client, "get_gtins_with_stock", return_value=["GTIN1", "GTIN2", "GTIN3"])
+    mocker.patch.object(
+        client, "_process_gtin_batch", side_effect=lambda gtins, *_args: [GtinStockItemDTO(gtin=gtin) for gtin in gtins]
+    )
+
+    saved_batches = []
+
+    def save_callback(_context: SupplierContextDTO, items: list[GtinStockItemDTO]) -> None:
+        saved_batches.append([item.gtin for item in items])
+        if items[0].gtin == "GTIN2":
+            raise RuntimeError("Deadlock found")
+
+    with caplog.at_level("INFO"):
+        result = client.fetch_gtin_stock_data_optimized(
+            sample_supplier_context_dto, batch_size=1, max_workers=1, save_callback=save_callback
+        )
+
+    assert saved_batches == [["GTIN1"], ["GTIN2"], ["GTIN3"]]
+    assert [item.gtin for item in result.stock_items] == ["GTIN1", "GTIN2", "GTIN3"]
+    assert "⚠️ Failed to save batch 2: Deadlock found" in caplog.messages
+    assert "💾 Saved batch 3 (1 items)" in caplog.messages
+
+
+def test_global_stock_api_client_close_closes_session(mocker) -> None:
+    """Tests that closing the client (or leaving its context) closes the HTTP session."""
+    client = GlobalStockApiClient()
+    mock_close = mocker.patch.object(client.session, "close")
+
+    with client:
+        pass
+
+    mock_close.assert_called_once()
@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import pytz
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from mysql.connector.cursor import RE_SQL_INSERT_STMT
 
 from src.common.config.settings import settings
 from src.common.dtos.availability_dtos import (
@@ -24,34 +25,86 @@ def test_mysql_gtin_stock_repository_create_tables_success(mocker) -> None:
     Tests that create_tables attempts to connect to DB and execute SQL queries.
     Uses a context manager to mock the connection and cursor.
     """
-    mock_connection = mocker.patch("mysql.connector.connect")
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection
     mock_cursor = Mock()
     mock_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.return_value = [(1,)]  # idx_supplier_gtin already present
 
     repo = MySQLGtinStockRepository()
-    repo._connection = None
 
     repo.create_tables()
 
     mock_connection.assert_called_once()
     mock_cursor.execute.assert_called()
-    assert mock_cursor.execute.call_count == 1
+    # CREATE TABLE plus the index lookup; no ALTER when the index exists
+    assert mock_cursor.execute.call_count == 2
+    assert "information_schema.STATISTICS" in mock_cursor.execute.call_args[0][0]
     mock_connection.return_value.commit.assert_called_once()
     mock_cursor.close.assert_called_once()
 
 
+def test_mysql_gtin_stock_repository_create_tables_adds_missing_supplier_gtin_index(mocker) -> None:
+    """
+    Tests that create_tables adds idx_supplier_gtin to a table that does not have it yet.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.return_value = []
+
+    MySQLGtinStockRepository().create_tables()
+
+    assert mock_cursor.execute.call_count == 3
+    assert mock_cursor.execute.call_args[0][0] == (
+        "ALTER TABLE pds_gtin_stock ADD INDEX idx_supplier_gtin (supplier_gln, gtin)"
+    )
+
+
+def test_mysql_gtin_stock_repository_create_tables_tolerates_concurrently_added_index(mocker) -> None:
+    """
+    Tests that create_tables succeeds when another process adds idx_supplier_gtin between the lookup and the ALTER.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection.return_value
+    mock_cursor = Mock()
+    mock_connection.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.execute.side_effect = [None, None, Error(msg="Duplicate key name", errno=errorcode.ER_DUP_KEYNAME)]
+
+    MySQLGtinStockRepository().create_tables()
+
+    assert mock_cursor.execute.call_count == 3
+    mock_connection.rollback.assert_not_called()
+    mock_cursor.close.assert_called_once()
+
+
+def test_mysql_gtin_stock_repository_create_tables_alter_index_error(mocker) -> None:
+    """
+    Tests that create_tables raises DatabaseError when adding idx_supplier_gtin fails for another reason.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.execute.side_effect = [None, None, Error(msg="Lock wait timeout", errno=errorcode.ER_LOCK_WAIT_TIMEOUT)]
+
+    with pytest.raises(DatabaseError, match="Error creating PDS GTIN Stock table"):
+        MySQLGtinStockRepository().create_tables()
+
+
 def test_mysql_gtin_stock_repository_save_gtin_stock_item(
     mocker, sample_supplier_context_dto, sample_gtin_stock_item_dto_js
 ) -> None:
     """
     Tests that save_gtin_stock_item calls the correct SQL INSERT/UPDATE.
     """
-    mock_connection = mocker.patch("mysql.connector.connect")
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection
     mock_cursor = Mock()
     mock_connection.return_value.cursor.return_value = mock_cursor
 
     repo = MySQLGtinStockRepository()
-    repo._connection = None
 
     repo.save_gtin_stock_item(sample_supplier_context_dto, sample_gtin_stock_item_dto_js)
 
@@ -66,15 +119,15 @@ def test_mysql_gtin_stock_repository_get_gtin_stock_by_supplier_context(mocker,
     """
     Tests that get_gtin_stock_by_supplier_context calls SELECT and parses results.
     """
-    mock_connection = mocker.patch("mysql.connector.connect")
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection
     mock_cursor = Mock()
     mock_connection.return_value.cursor.return_value = mock_cursor
 
     repo = MySQLGtinStockRepository()
-    repo._connection = None
 
-    # Simulate database rows returned
-    mock_cursor.fetchall.return_value = [
+    # Simulate database rows returned, streamed in two fetchmany chunks
+    rows = [
         {
             "retailer_id": "NOT_USED",  # These fields are no longer in the DB schema for this table
             "retailer_gln": "NOT_USED",
@@ -100,8 +153,9 @@ def test_mysql_gtin_stock_repository_get_gtin_stock_by_supplier_context(mocker,
             "timestamp": datetime(2023, 1, 1, 11, 0, 0, tzinfo=pytz.utc),
         },
     ]
+    mock_cursor.fetchmany.side_effect = [rows[:1], rows[1:], []]
 
-    result = repo.get_gtin_stock_by_supplier_context(sample_supplier_context_dto)
+    result = repo.get_gtin_stock_by_supplier_context(sample_supplier_context_dto, fetch_size=1)
 
     mock_connection.assert_called_once()
     mock_cursor.execute.assert_called_once()
@@ -118,6 +172,80 @@ def test_mysql_gtin_stock_repository_get_gtin_stock_by_supplier_context(mocker,
     assert result.stock_items[0].stock_traffic_light == "Green"
     assert result.stock_items[0].item_type == "Pair"
     assert result.stock_items[0].timestamp.year == 2023
+    assert result.stock_items[1].gtin == "1234567890002"
+    mock_connection.return_value.cursor.assert_called_once_with(dictionary=True, buffered=False)
+    mock_cursor.fetchmany.assert_called_with(1)
+
+
+def test_mysql_gtin_stock_repository_get_by_supplier_context_error_drains_unread_rows(
+    mocker, sample_supplier_context_dto
+) -> None:
+    """
+    Tests that a failure mid-read consumes pending rows before the connection goes back to the pool.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection.return_value
+    mock_cursor = Mock()
+    mock_connection.cursor.return_value = mock_cursor
+    mock_connection.unread_result = True
+    row = {
+        "gtin": "1234567890001",
+        "quantity": 1,
+        "stock_traffic_light": "Green",
+        "item_type": "Pair",
+        "timestamp": None,
+    }
+    mock_cursor.fetchmany.side_effect = [[row], Error("Lost connection")]
+
+    repo = MySQLGtinStockRepository()
+
+    with pytest.raises(DatabaseError, match="Error fetching GTIN stock by supplier GLN"):
+        repo.get_gtin_stock_by_supplier_context(sample_supplier_context_dto, fetch_size=1)
+
+    mock_connection.consume_results.assert_called_once()
+    mock_cursor.close.assert_called_once()
+    mock_connection.close.assert_called_once()
+
+
+def test_mysql_gtin_stock_repository_batch_save_chunks_rows(
+    mocker, sample_supplier_context_dto, sample_gtin_stock_item_dto_list
+) -> None:
+    """
+    Tests that batch_save_gtin_stock_items sends rows in chunks and commits once.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_connection = mock_get_pool.return_value.get_connection.return_value
+    mock_cursor = Mock()
+    mock_connection.cursor.return_value = mock_cursor
+
+    repo = MySQLGtinStockRepository()
+    repo.batch_save_gtin_stock_items(sample_supplier_context_dto, sample_gtin_stock_item_dto_list, chunk_size=1)
+
+    assert mock_cursor.executemany.call_count == len(sample_gtin_stock_item_dto_list)
+    assert all(len(call.args[1]) == 1 for call in mock_cursor.executemany.call_args_list)
+    mock_connection.commit.assert_called_once()
+    mock_connection.close.assert_called_once()
+
+
+def test_mysql_gtin_stock_repository_batch_save_defaults_to_chunk_rows(
+    mocker, sample_supplier_context_dto, sample_gtin_stock_item_dto_js
+) -> None:
+    """
+    Tests that batch_save_gtin_stock_items splits items into CHUNK_ROWS-sized executemany calls by default,
+    each with an upsert mysql-connector can rewrite into a single multi-row INSERT.
+    """
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mocker.patch.object(MySQLGtinStockRepository, "CHUNK_ROWS", 2)
+
+    MySQLGtinStockRepository().batch_save_gtin_stock_items(
+        sample_supplier_context_dto, [sample_gtin_stock_item_dto_js] * 5
+    )
+
+    chunks = [call.args for call in mock_cursor.executemany.call_args_list]
+    assert [len(params) for _, params in chunks] == [2, 2, 1]
+    assert all(RE_SQL_INSERT_STMT.match(sql) for sql, _ in chunks)
 
 
 # Helper fixture to provide a fresh repository instance with mocked settings
@@ -131,18 +259,17 @@ def mysql_gtin_stock_repository_with_mock_settings(mocker) -> MySQLGtinStockRepo
     return MySQLGtinStockRepository()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_all_gtin_codes_success(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test successful retrieval of GTIN codes."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
 
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
 
     expected_gtins = [("1234567890123",), ("1234567890124",), ("1234567890125",)]
     mock_cursor.fetchall.return_value = expected_gtins
@@ -159,17 +286,16 @@ def test_get_all_gtin_codes_success(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_all_gtin_codes_empty_result(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test retrieval when no GTIN codes exist."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
     mock_cursor.fetchall.return_value = []
 
     # Act
@@ -180,17 +306,16 @@ def test_get_all_gtin_codes_empty_result(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_all_gtin_codes_database_error(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test handling of database errors during GTIN retrieval."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
     mock_cursor.execute.side_effect = Error("Database connection failed")
 
     # Act & Assert
@@ -200,17 +325,16 @@ def test_get_all_gtin_codes_database_error(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_unique_supplier_glns_success(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test successful retrieval of supplier GLNs."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
 
     expected_glns = [("5790000017089",), ("1234567890001",), ("9876543210001",)]
     mock_cursor.fetchall.return_value = expected_glns
@@ -227,17 +351,16 @@ def test_get_unique_supplier_glns_success(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_unique_supplier_glns_empty_result(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test retrieval when no supplier GLNs exist."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
     mock_cursor.fetchall.return_value = []
 
     # Act
@@ -248,17 +371,16 @@ def test_get_unique_supplier_glns_empty_result(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_get_unique_supplier_glns_database_error(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test handling of database errors during supplier GLN retrieval."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
     mock_cursor.execute.side_effect = Error("Database connection failed")
 
     # Act & Assert
@@ -268,17 +390,16 @@ def test_get_unique_supplier_glns_database_error(
     mock_cursor.close.assert_called_once()
 
 
-@patch("mysql.connector.connect")
-def test_connection_reuse(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+@patch("src.common.utils.db_utils.get_connection_pool")
+def test_connection_returned_to_pool(
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
-    """Test that connection is reused when still connected."""
+    """Test that every call borrows a pooled connection and hands it back afterwards."""
     # Arrange
     mock_connection = MagicMock()
     mock_cursor = MagicMock()
-    mock_connect.return_value = mock_connection
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
     mock_connection.cursor.return_value = mock_cursor
-    mock_connection.is_connected.return_value = True
     mock_cursor.fetchall.return_value = []
 
     # Act
@@ -286,22 +407,111 @@ def test_connection_reuse(
     mysql_gtin_stock_repository_with_mock_settings.get_unique_supplier_glns()
 
     # Assert
-    mock_connect.assert_called_once()
+    assert mock_get_pool.return_value.get_connection.call_count == 2
+    assert mock_connection.close.call_count == 2
 
     assert mock_cursor.close.call_count == 2
     assert mock_cursor.execute.call_count == 2
 
 
-@patch("mysql.connector.connect")
+@patch("src.common.utils.db_utils.get_connection_pool")
 def test_connection_error(
-    mock_connect: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
 ) -> None:
     """Test handling of connection errors."""
     # Arrange
-    mock_connect.side_effect = Error("Connection failed")
+    mock_get_pool.return_value.get_connection.side_effect = Error("Connection failed")
 
     # Act & Assert
-    with pytest.raises(DatabaseError, match="Failed to connect to MySQL"):
+    with pytest.raises(DatabaseError, match="Failed to get MySQL connection from pool"):
         mysql_gtin_stock_repository_with_mock_settings.get_all_gtin_codes()
 
-    mock_connect.assert_called_once()
+    mock_get_pool.return_value.get_connection.assert_called_once()
+
+
+@patch("src.common.utils.db_utils.get_connection_pool")
+def test_get_recently_synced_gtins(
+    mock_get_pool: Mock, mysql_gtin_stock_repository_with_mock_settings: MySQLGtinStockRepository
+) -> None:
+    """Test that recently synced GTINs are fetched with one query filtered by supplier and age."""
+    mock_connection = MagicMock()
+    mock_cursor = MagicMock()
+    mock_get_pool.return_value.get_connection.return_value = mock_connection
+    mock_connection.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.return_value = [("1234567890123",), ("1234567890124",)]
+
+    result = mysql_gtin_stock_repository_with_mock_settings.get_recently_synced_gtins("5790000017089", 3600)
+
+    assert result == {"1234567890123", "1234567890124"}
+    mock_cursor.execute.assert_called_once()
+    assert mock_cursor.execute.call_args[0][1] == ("5790000017089", 3600)
+    mock_cursor.close.assert_called_once()
+
+
+def test_mysql_gtin_stock_repository_check_existing_pairs_in_chunks(mocker) -> None:
+    """Tests that pair lookups are split into chunks, deduplicated and merged into one set."""
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.side_effect = [[("G1", "S1")], [("G3", "S1")]]
+
+    repo = MySQLGtinStockRepository()
+    pairs = [("G1", "S1"), ("G2", "S1"), ("G1", "S1"), ("G3", "S1")]
+
+    result = repo.check_existing_gtin_supplier_pairs(pairs, chunk_size=2)
+
+    assert result == {("G1", "S1"), ("G3", "S1")}
+    assert mock_cursor.execute.call_count == 2
+    first_query, first_params = mock_cursor.execute.call_args_list[0][0]
+    assert first_query.count("(%s, %s)") == 2
+    assert first_params == ["G1", "S1", "G2", "S1"]
+    assert mock_cursor.execute.call_args_list[1][0][1] == ["G3", "S1"]
+    mock_cursor.close.assert_called_once()
+
+
+def test_mysql_gtin_stock_repository_check_existing_pairs_empty(mocker) -> None:
+    """Tests that an empty pair list does not touch the database."""
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+
+    assert MySQLGtinStockRepository().check_existing_gtin_supplier_pairs([]) == set()
+    mock_get_pool.assert_not_called()
+
+
+def test_distinct_getters_are_cached_until_next_write(mocker, sample_supplier_context_dto) -> None:
+    """Tests that DISTINCT getters hit the database once and are reloaded after a save."""
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.side_effect = [[("G1",)], [("G1",), ("G2",)]]
+
+    repo = MySQLGtinStockRepository()
+
+    assert repo.get_all_gtin_codes() == ["G1"]
+    assert repo.get_all_gtin_codes() == ["G1"]
+    assert mock_cursor.execute.call_count == 1
+
+    repo.batch_save_gtin_stock_items(sample_supplier_context_dto, [GtinStockItemDTO(gtin="G2", quantity=1)])
+
+    assert repo.get_all_gtin_codes() == ["G1", "G2"]
+    assert mock_cursor.fetchall.call_count == 2
+
+
+def test_distinct_getters_cache_expires_after_ttl(mocker) -> None:
+    """Tests that cached DISTINCT results are reloaded once older than the TTL (writes by other processes)."""
+    mock_get_pool = mocker.patch("src.common.utils.db_utils.get_connection_pool")
+    mock_cursor = Mock()
+    mock_get_pool.return_value.get_connection.return_value.cursor.return_value = mock_cursor
+    mock_cursor.fetchall.side_effect = [[("S1",)], [("S1",), ("S2",)]]
+    mock_monotonic = mocker.patch(
+        "src.product_availability_domain.infrastructure.persistence.mysql_gtin_stock_repository.time.monotonic",
+        return_value=1000.0,
+    )
+
+    repo = MySQLGtinStockRepository()
+
+    assert repo.get_unique_supplier_glns() == ["S1"]
+    mock_monotonic.return_value = 1000.0 + MySQLGtinStockRepository._DISTINCT_CACHE_TTL_SECONDS - 1
+    assert repo.get_unique_supplier_glns() == ["S1"]
+    mock_monotonic.return_value = 1000.0 + MySQLGtinStockRepository._DISTINCT_CACHE_TTL_SECONDS
+    assert repo.get_unique_supplier_glns() == ["S1", "S2"]
+    assert mock_cursor.execute.call_count == 2
@@ -0,0 +1,47 @@
+# tests/test_step1_main.py
+"""Tests for the scheduled GTIN stock synchronization entry point."""
+
+from unittest.mock import call
+
+import step1_main
+from src.common.config.settings import settings
+from src.common.dtos.availability_dtos import GtinStockResponseDTO
+
+
+def test_run_gtin_stock_sync_process_optimized_skips_fresh_gtins(
+    gtin_stock_service,
+    mock_global_stock_api_client,
+    mock_gtin_stock_repository,
+    sample_suppliers_json_data,
+    sample_supplier_context_dto,
+    mocker,
+) -> None:
+    """Tests that the scheduled job passes recently synced GTINs to the API client as skipped."""
+    mocker.patch.object(settings, "STOCK_REFRESH_TTL_SECONDS", 3600)
+    mocker.patch.object(
+        step1_main,
+        "setup_gtin_stock_dependencies",
+        return_value=(gtin_stock_service, mock_gtin_stock_repository),
+    )
+    mocker.patch.object(step1_main, "load_suppliers_list", return_value=tuple(sample_suppliers_json_data))
+    mocker.patch.object(step1_main, "display_sample_data")
+    mock_gtin_stock_repository.get_recently_synced_gtins.side_effect = lambda gln, _ttl: {f"fresh-{gln}"}
+    mock_global_stock_api_client.fetch_gtin_stock_data_optimized.return_value = GtinStockResponseDTO(
+        supplier_context=sample_supplier_context_dto
+    )
+
+    step1_main.run_gtin_stock_sync_process_optimized()
+
+    mock_gtin_stock_repository.get_recently_synced_gtins.assert_has_calls(
+        [call(supplier["SUPPLIER_GLN"], 3600) for supplier in sample_suppliers_json_data], any_order=True
+    )
+    fetch_calls = mock_global_stock_api_client.fetch_gtin_stock_data_optimized.call_args_list
+    assert {
+        fetch_call.kwargs["supplier_context"].supplier_gln: fetch_call.kwargs["skip_gtins"]
+        for fetch_call in fetch_calls
+    } == {supplier["SUPPLIER_GLN"]: {f"fresh-{supplier['SUPPLIER_GLN']}"} for supplier in sample_suppliers_json_data}
+    assert all(
+        fetch_call.kwargs["save_callback"] == mock_gtin_stock_repository.batch_save_gtin_stock_items
+        for fetch_call in fetch_calls
+    )
+    mock_global_stock_api_client.close.assert_called_once()